@@ -0,0 +1,131 @@
+import atexit
+import queue
+import threading
+import time
+from datetime import datetime
+from flask import current_app
+from sqlalchemy import insert
+from database.db import db
+from models.logs import AssignmentLog
+from ai.change_feed import change, record_changes
+from config import Config
+
+_STOP = object()
+
+
+class AssignmentLogWriter:
+    """Buffers ``AssignmentLog`` rows and bulk-inserts them from a background thread.
+
+    A batch is written as soon as ``batch_size`` rows are queued or the oldest
+    queued row has waited ``max_latency`` seconds. Pending rows are flushed when
+    the process exits. A batch that fails is retried ``retries`` times; rows
+    that still cannot be stored are printed instead of vanishing.
+    """
+
+    def __init__(self, batch_size=100, max_latency=1.0, retries=2, retry_delay=0.5):
+        self.batch_size = batch_size
+        self.max_latency = max_latency
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._app = None
+        self._closed = False
+
+    def write(self, employee_id, message):
+        """Queue a log row; it is stamped now but stored by the next flush."""
+        row = {"employee_id": employee_id, "log_message": message, "timestamp": datetime.utcnow()}
+        if self._closed:
+            #  Shutting down: there may be no app context left to store it in
+            print(f"⚠️ Log writer closed, dropping log entry for Employee {employee_id}: {message}")
+            return
+        self._ensure_started()
+        self._queue.put(row)
+
+    def flush(self):
+        """Block until every queued row has been stored."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self, timeout=10):
+        """Flush pending rows and stop the background thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        if self._thread is not None:
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+
+    def _ensure_started(self):
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._app = current_app._get_current_object()
+                self._thread = threading.Thread(target=self._run, name="assignment-log-writer", daemon=True)
+                self._thread.start()
+                atexit.register(self.close)
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            first = self._queue.get()
+            if first is _STOP:
+                self._queue.task_done()
+                return
+
+            batch = [first]
+            deadline = time.monotonic() + self.max_latency
+            while len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    row = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if row is _STOP:
+                    self._queue.task_done()
+                    stopping = True
+                    break
+                batch.append(row)
+
+            try:
+                self._store(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _store(self, rows):
+        for attempt in range(self.retries + 1):
+            if attempt:
+                time.sleep(self.retry_delay * attempt)
+            if self._insert(rows):
+                return
+        for row in rows:
+            print(f"⚠️ Lost log entry for Employee {row['employee_id']} at {row['timestamp']:%Y-%m-%d %H:%M:%S}: {row['log_message']}")
+
+    def _insert(self, rows):
+        """Store one batch in its own transaction; False if it was rolled back."""
+        with self._app.app_context():
+            try:
+                db.session.execute(insert(AssignmentLog), rows)
+                record_changes(
+                    change("log_added", {"timestamp": row["timestamp"], "message": row["log_message"]}, employee_id=row["employee_id"])
+                    for row in rows
+                )
+                db.session.commit()
+                return True
+            except Exception as e:
+                db.session.rollback()
+                print(f"⚠️ Failed to store {len(rows)} log entries: {e}")
+                return False
+
+
+# ✅ Shared writer used by log_assignment
+assignment_log_writer = AssignmentLogWriter(
+    batch_size=Config.ASSIGNMENT_LOG_BATCH_SIZE,
+    max_latency=Config.ASSIGNMENT_LOG_MAX_LATENCY
+)
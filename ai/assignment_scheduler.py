@@ -0,0 +1,144 @@
+import atexit
+import queue
+import threading
+import time
+from flask import current_app
+from database.db import db
+from ai.task_assigner import ai_task_agent
+from ai.leader_lease import LeaderLease
+from ai.change_feed import prune_changes
+from config import Config
+
+
+class AssignmentScheduler:
+    """Event-driven replacement for the periodic assignment loop.
+
+    Producers report what changed (subtasks created, a subtask completed, an
+    employee added) and a single background thread reacts. Events arriving
+    within ``coalesce_window`` seconds of each other are merged, so a burst
+    becomes one scoped pass: new subtasks are only matched against free
+    employees, and new or freed employees only look for work for themselves.
+    A full pass plus task rollup still runs every ``sweep_interval`` seconds
+    as a safety net for changes made outside the app; it also drops change
+    events older than ``change_retention`` seconds.
+
+    Events are handled by the process that observed them, but with a
+    ``lease`` the sweep only runs in the process currently holding it, so
+    adding web workers does not multiply the background load. The lease is
+    renewed every ``lease_renew_interval`` seconds.
+    """
+
+    def __init__(self, agent, sweep_interval=600, coalesce_window=0.5, lease=None, lease_renew_interval=10,
+                 change_retention=3600):
+        self.agent = agent
+        self.sweep_interval = sweep_interval
+        self.coalesce_window = coalesce_window
+        self.lease = lease
+        self.lease_renew_interval = lease_renew_interval
+        self.change_retention = change_retention
+        self._events = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread = None
+        self._app = None
+
+    def notify_subtasks_created(self, subtask_ids):
+        self._publish("subtasks_created", list(subtask_ids))
+
+    def notify_subtask_completed(self, employee_id):
+        self._publish("subtask_completed", employee_id)
+
+    def notify_employee_added(self, employee_id):
+        self._publish("employee_added", employee_id)
+
+    def _publish(self, kind, payload):
+        if self._thread is None and not current_app.config.get("START_BACKGROUND_SERVICES", True):
+            return  # ✅ Web-only process: the process running the services picks this up on its next sweep
+        self.start()
+        self._events.put((kind, payload))
+
+    def start(self, app=None):
+        """Start the scheduler thread once per process."""
+        with self._lock:
+            if self._thread:
+                return
+            self._app = app or current_app._get_current_object()
+            self._thread = threading.Thread(target=self._run, name="assignment-scheduler", daemon=True)
+            self._thread.start()
+            if self.lease:
+                atexit.register(self._release_lease)
+
+    def _release_lease(self):
+        with self._app.app_context():
+            self.lease.release()
+
+    def _run(self):
+        next_sweep = time.monotonic() + self.sweep_interval
+        next_renew = time.monotonic()
+        while True:
+            wake_at = min(next_sweep, next_renew) if self.lease else next_sweep
+            try:
+                events = [self._events.get(timeout=max(0, wake_at - time.monotonic()))]
+            except queue.Empty:
+                events = []
+
+            if events:
+                #  Give the rest of a burst a moment to arrive, then take everything queued
+                time.sleep(self.coalesce_window)
+                while True:
+                    try:
+                        events.append(self._events.get_nowait())
+                    except queue.Empty:
+                        break
+
+            with self._app.app_context():
+                try:
+                    if events:
+                        self._process(events)
+                    if self.lease and time.monotonic() >= next_renew:
+                        next_renew = time.monotonic() + self.lease_renew_interval
+                        self.lease.renew()
+                    if time.monotonic() >= next_sweep:
+                        next_sweep = time.monotonic() + self.sweep_interval
+                        if self.lease is None or self.lease.is_leader:
+                            print("🔄 Running safety-net assignment sweep...")
+                            self.agent.assign_tasks()
+                            self.agent.check_and_update_task_status()
+                            prune_changes(self.change_retention)
+                except Exception as e:
+                    db.session.rollback()
+                    print(f"⚠️ Assignment scheduler error: {e}")
+                finally:
+                    db.session.remove()
+
+    def _process(self, events):
+        """Run the scoped passes for a coalesced batch of events."""
+        new_subtasks, freed_employees, new_employees = set(), [], set()
+        for kind, payload in events:
+            if kind == "subtasks_created":
+                new_subtasks.update(payload)
+            elif kind == "subtask_completed" and payload not in freed_employees:
+                freed_employees.append(payload)
+            elif kind == "employee_added":
+                new_employees.add(payload)
+        print(f"🔄 Processing {len(events)} assignment events "
+              f"({len(new_subtasks)} new subtasks, {len(freed_employees)} freed, {len(new_employees)} new employees)")
+
+        for employee_id in freed_employees:
+            self.agent.assign_next_subtask(employee_id)
+        if freed_employees:
+            self.agent.check_and_update_task_status()
+        if new_employees:
+            self.agent.assign_tasks(employee_ids=new_employees)
+        if new_subtasks:
+            self.agent.assign_tasks(subtask_ids=new_subtasks)
+
+
+# ✅ Shared scheduler; producers call the notify_* methods
+assignment_scheduler = AssignmentScheduler(
+    ai_task_agent,
+    sweep_interval=Config.TASK_ASSIGNMENT_INTERVAL,
+    coalesce_window=Config.TASK_ASSIGNMENT_COALESCE_WINDOW,
+    lease=LeaderLease("assignment-sweep", ttl=Config.SCHEDULER_LEASE_TTL),
+    lease_renew_interval=Config.SCHEDULER_LEASE_RENEW_INTERVAL,
+    change_retention=Config.CHANGE_FEED_RETENTION
+)
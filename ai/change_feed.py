@@ -0,0 +1,227 @@
+import json
+import queue
+import threading
+import time
+from datetime import datetime, timedelta
+from flask import current_app
+from sqlalchemy import delete, event, func, insert, or_
+from sqlalchemy.orm import Session
+from database.db import db
+from models.change_event import ChangeEvent
+from controllers.http_cache import bump_versions
+from config import Config
+
+
+#  Event kinds that change no versioned body (project details, employee tasks), so their ETags stay valid
+UNVERSIONED_KINDS = {"log_added"}
+
+
+def change(kind, data, project_id=None, employee_id=None):
+    """Build a ``change_events`` row for ``record_changes``."""
+    return {
+        "kind": kind,
+        "project_id": project_id,
+        "employee_id": None if employee_id is None else str(employee_id),
+        "payload": json.dumps(data, default=str),
+        "created_at": datetime.utcnow(),
+    }
+
+
+def record_changes(changes):
+    """Add change rows in one executemany and bump the versions of the projects
+    and employees whose bodies they change. Nothing is committed: call it
+    inside the transaction that makes the change, so clients never see a
+    change that was rolled back."""
+    changes = list(changes)
+    if changes:
+        db.session.execute(insert(ChangeEvent), changes)
+        versioned = [c for c in changes if c["kind"] not in UNVERSIONED_KINDS]
+        bump_versions(
+            {("project", c["project_id"]) for c in versioned if c["project_id"] is not None}
+            | {("employee", c["employee_id"]) for c in versioned if c["employee_id"] is not None}
+        )
+        db.session.info["change_feed_pending"] = True
+
+
+def prune_changes(max_age):
+    """Delete change rows older than ``max_age`` seconds; returns how many went."""
+    result = db.session.execute(
+        delete(ChangeEvent).where(ChangeEvent.created_at < datetime.utcnow() - timedelta(seconds=max_age))
+    )
+    db.session.commit()
+    return result.rowcount
+
+
+class Subscription:
+    """One connected client: the events of a project and/or employee, in a bounded queue."""
+
+    def __init__(self, project_id=None, employee_id=None, maxsize=1000):
+        self.project_id = project_id
+        self.employee_id = None if employee_id is None else str(employee_id)
+        self.events = queue.Queue(maxsize)
+        self.overflowed = False  # ✅ Client fell too far behind and must reload
+
+    def matches(self, event):
+        return (
+            (self.project_id is None or event["project_id"] == self.project_id)
+            and (self.employee_id is None or event["employee_id"] == self.employee_id)
+        )
+
+    def deliver(self, event):
+        if self.overflowed:
+            return
+        try:
+            self.events.put_nowait(event)
+        except queue.Full:
+            self.overflowed = True
+
+
+class ChangeFeed:
+    """Fans ``change_events`` rows out to the subscribed clients of this process.
+
+    A single background thread polls the table by id while at least one
+    client is connected, so the database sees one indexed range query per
+    ``poll_interval`` per process however many dashboards are open, and
+    changes committed by any worker reach every stream; commits made in this
+    process wake the poller right away. Ids skipped by a poll (a transaction
+    that took its id earlier but committed later) are looked for again for
+    ``gap_timeout`` seconds.
+    """
+
+    def __init__(self, poll_interval=0.5, queue_size=1000, batch_size=500, gap_timeout=10.0):
+        self.poll_interval = poll_interval
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.gap_timeout = gap_timeout
+        self._subscribers = set()
+        self._lock = threading.Condition()
+        self._thread = None
+        self._app = None
+        self._woken = False
+        self._last_id = 0
+        self._gaps = {}  # missing id -> monotonic deadline
+
+    def subscribe(self, project_id=None, employee_id=None, after_id=None):
+        """Register a client. Returns ``(subscription, backlog)``.
+
+        ``backlog`` holds the stored events after ``after_id`` (a resumed
+        stream), or is None when there are more than fit in the queue and the
+        client should reload instead.
+        """
+        self._ensure_started()
+        subscription = Subscription(project_id, employee_id, self.queue_size)
+        with self._lock:
+            if not self._subscribers:
+                #  Nobody was listening: start from the current end of the table
+                self._last_id = db.session.query(func.max(ChangeEvent.id)).scalar() or 0
+                self._gaps.clear()
+            position = self._last_id
+            self._subscribers.add(subscription)
+            self._lock.notify()
+
+        backlog = []
+        if after_id is not None and after_id < position:
+            query = db.session.query(
+                ChangeEvent.id, ChangeEvent.kind, ChangeEvent.project_id, ChangeEvent.employee_id, ChangeEvent.payload
+            ).filter(ChangeEvent.id > after_id, ChangeEvent.id <= position)
+            if subscription.project_id is not None:
+                query = query.filter(ChangeEvent.project_id == subscription.project_id)
+            if subscription.employee_id is not None:
+                query = query.filter(ChangeEvent.employee_id == subscription.employee_id)
+            rows = query.order_by(ChangeEvent.id).limit(self.queue_size + 1).all()
+            backlog = None if len(rows) > self.queue_size else [self._event(row) for row in rows]
+        return subscription, backlog
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            self._subscribers.discard(subscription)
+
+    def wake(self):
+        """Poll now instead of at the end of the current interval."""
+        with self._lock:
+            self._woken = True
+            self._lock.notify_all()
+
+    def _ensure_started(self):
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._app = current_app._get_current_object()
+                self._thread = threading.Thread(target=self._run, name="change-feed", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._lock:
+                while not self._subscribers:
+                    self._lock.wait()
+                last_id, gaps = self._last_id, list(self._gaps)
+
+            rows = []
+            with self._app.app_context():
+                try:
+                    condition = ChangeEvent.id > last_id
+                    if gaps:
+                        condition = or_(condition, ChangeEvent.id.in_(gaps))
+                    rows = (
+                        db.session.query(
+                            ChangeEvent.id, ChangeEvent.kind, ChangeEvent.project_id,
+                            ChangeEvent.employee_id, ChangeEvent.payload
+                        )
+                        .filter(condition)
+                        .order_by(ChangeEvent.id)
+                        .limit(self.batch_size)
+                        .all()
+                    )
+                except Exception as e:
+                    print(f"⚠️ Change feed poll failed: {e}")
+                finally:
+                    db.session.remove()
+
+            with self._lock:
+                self._dispatch(rows)
+
+            if len(rows) < self.batch_size:
+                with self._lock:
+                    if not self._woken:
+                        self._lock.wait(self.poll_interval)
+                    self._woken = False
+
+    def _dispatch(self, rows):
+        """Hand new rows to matching subscribers. Called with the lock held."""
+        now = time.monotonic()
+        for row in rows:
+            if row.id in self._gaps:
+                del self._gaps[row.id]
+            elif row.id <= self._last_id:
+                continue  # ✅ Already delivered
+            else:
+                for missing in range(max(self._last_id + 1, row.id - self.batch_size), row.id):
+                    self._gaps[missing] = now + self.gap_timeout
+                self._last_id = row.id
+
+            event = self._event(row)
+            for subscription in self._subscribers:
+                if subscription.matches(event):
+                    subscription.deliver(event)
+
+        self._gaps = {missing: deadline for missing, deadline in self._gaps.items() if deadline > now}
+
+    @staticmethod
+    def _event(row):
+        event_id, kind, project_id, employee_id, payload = row
+        return {"id": event_id, "kind": kind, "project_id": project_id, "employee_id": employee_id, "data": json.loads(payload)}
+
+
+@event.listens_for(Session, "after_commit")
+def _wake_change_feed(session):
+    if session.info.pop("change_feed_pending", False):
+        change_feed.wake()
+
+
+# ✅ Shared feed behind /api/events
+change_feed = ChangeFeed(
+    poll_interval=Config.CHANGE_FEED_POLL_INTERVAL,
+    queue_size=Config.CHANGE_FEED_QUEUE_SIZE
+)
@@ -0,0 +1,117 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import unicodedata
+
+
+def normalize_description(description):
+    """Canonical form of a project description: NFKC, case-folded, single-spaced."""
+    return " ".join(unicodedata.normalize("NFKC", description).casefold().split())
+
+
+def completion_cache_key(description, prompt_version, model, temperature):
+    """Content address of a completion: hash of everything that shapes the output."""
+    payload = json.dumps([normalize_description(description), prompt_version, model, temperature])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class CompletionCache:
+    """Persistent cache of raw LLM completions keyed by ``completion_cache_key``.
+
+    Entries live in a standalone SQLite file rather than the application
+    database, so they survive a reset of the main schema. Entries expire after
+    ``ttl`` seconds and the least recently used ones are evicted beyond
+    ``max_entries``. Hit/miss/eviction counters are kept per process.
+    """
+
+    def __init__(self, path, ttl=30 * 24 * 3600, max_entries=1000, enabled=True):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=10)
+        if not self._initialized:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS completions ("
+                " key TEXT PRIMARY KEY, completion TEXT NOT NULL,"
+                " created_at REAL NOT NULL, last_used_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_completions_last_used_at ON completions (last_used_at)")
+            conn.commit()
+            self._initialized = True
+        return conn
+
+    def get(self, key):
+        """Return the cached completion for ``key`` or None (expired entries count as misses)."""
+        if not self.enabled:
+            return None
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            try:
+                row = conn.execute("SELECT completion, created_at FROM completions WHERE key = ?", (key,)).fetchone()
+                if row and now - row[1] <= self.ttl:
+                    conn.execute("UPDATE completions SET last_used_at = ? WHERE key = ?", (now, key))
+                    conn.commit()
+                    self.hits += 1
+                    return row[0]
+                if row:
+                    conn.execute("DELETE FROM completions WHERE key = ?", (key,))
+                    conn.commit()
+                    self.evictions += 1
+                self.misses += 1
+                return None
+            finally:
+                conn.close()
+
+    def put(self, key, completion):
+        """Store a completion and evict expired and least recently used entries."""
+        if not self.enabled:
+            return
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO completions (key, completion, created_at, last_used_at) VALUES (?, ?, ?, ?)",
+                    (key, completion, now, now)
+                )
+                evicted = conn.execute("DELETE FROM completions WHERE created_at < ?", (now - self.ttl,)).rowcount
+                evicted += conn.execute(
+                    "DELETE FROM completions WHERE key IN ("
+                    " SELECT key FROM completions ORDER BY last_used_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,)
+                ).rowcount
+                conn.commit()
+                self.evictions += evicted
+            finally:
+                conn.close()
+
+    def stats(self):
+        """Hit/miss metrics plus the current number of stored entries."""
+        lookups = self.hits + self.misses
+        entries = 0
+        if self.enabled:
+            with self._lock:
+                conn = self._connect()
+                try:
+                    entries = conn.execute("SELECT COUNT(*) FROM completions").fetchone()[0]
+                finally:
+                    conn.close()
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "entries": entries,
+        }
@@ -0,0 +1,187 @@
+import json
+import threading
+from datetime import datetime, timedelta
+from flask import current_app
+from sqlalchemy import update
+from database.db import db
+from models.generation_job import GenerationJob
+from config import Config
+
+
+class GenerationJobQueue:
+    """DB-backed queue running AI task generation on a bounded pool of worker threads.
+
+    Jobs live in ``generation_jobs`` so queued work survives restarts; jobs left
+    ``running`` by a dead process are requeued once their heartbeat is older
+    than ``stale_after`` seconds. The pool size caps concurrent LLM calls.
+    """
+
+    def __init__(self, workers=2, poll_interval=5, stale_after=600, max_attempts=3):
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.stale_after = stale_after
+        self.max_attempts = max_attempts
+        self._wakeup = threading.Event()
+        self._lock = threading.Lock()
+        self._threads = []
+        self._app = None
+        self._closed = False
+
+    def enqueue(self, project_id):
+        """Queue a generation job for a project and return it.
+
+        The job is run by this process's workers, started on demand, unless
+        ``START_BACKGROUND_SERVICES`` is off; then it waits in the table for
+        a process that runs them.
+        """
+        job = GenerationJob(project_id=project_id, status='queued')
+        db.session.add(job)
+        db.session.commit()
+        if current_app.config.get("START_BACKGROUND_SERVICES", True):
+            self.start()
+            self._wakeup.set()
+        return job
+
+    def start(self, app=None):
+        """Start the worker threads, replacing any that died (idempotent)."""
+        with self._lock:
+            self._threads = [thread for thread in self._threads if thread.is_alive()]
+            if self._closed or len(self._threads) >= self.workers:
+                return
+            self._app = app or self._app or current_app._get_current_object()
+            running = {thread.name for thread in self._threads}
+            for index in range(self.workers):
+                name = f"generation-worker-{index}"
+                if name not in running:
+                    thread = threading.Thread(target=self._work, name=name, daemon=True)
+                    thread.start()
+                    self._threads.append(thread)
+
+    def close(self, timeout=10):
+        """Stop the workers once their current job is done; queued jobs stay queued."""
+        with self._lock:
+            self._closed = True
+            threads = list(self._threads)
+        self._wakeup.set()
+        for thread in threads:
+            thread.join(timeout)
+
+    def _work(self):
+        while not self._closed:
+            job_id = None
+            with self._app.app_context():
+                try:
+                    job_id = self._claim_next()
+                    if job_id is not None:
+                        self._run(job_id)
+                        continue
+                except Exception as e:
+                    #  A database error must not kill the worker: give up on the job and back off
+                    print(f"⚠️ Generation worker error: {e}")
+                    db.session.rollback()
+                    if job_id is not None:
+                        self._fail(job_id, f"Unexpected error: {str(e)}")
+            self._wakeup.wait(self.poll_interval)
+            self._wakeup.clear()
+
+    def _fail(self, job_id, error):
+        """Mark a running job failed; best effort, the stale-job recovery covers a failure here."""
+        try:
+            db.session.execute(
+                update(GenerationJob)
+                .where(GenerationJob.id == job_id, GenerationJob.status == 'running')
+                .values(status='failed', error=error, finished_at=datetime.utcnow())
+            )
+            db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            print(f"⚠️ Could not mark generation job {job_id} failed: {e}")
+
+    def _claim_next(self):
+        """Atomically move the oldest queued job to running; returns its id or None."""
+        self._recover_stale_jobs()
+        while True:
+            job_id = db.session.query(GenerationJob.id).filter_by(status='queued').order_by(GenerationJob.id).limit(1).scalar()
+            if job_id is None:
+                db.session.commit()
+                return None
+
+            now = datetime.utcnow()
+            claimed = db.session.execute(
+                update(GenerationJob)
+                .where(GenerationJob.id == job_id, GenerationJob.status == 'queued')
+                .values(status='running', started_at=now, heartbeat_at=now, attempts=GenerationJob.attempts + 1)
+            ).rowcount
+            db.session.commit()
+            if claimed:
+                return job_id  # ✅ Otherwise another worker won the race, try the next job
+
+    def _recover_stale_jobs(self):
+        """Requeue (or fail, after max_attempts) jobs whose worker stopped heartbeating."""
+        cutoff = datetime.utcnow() - timedelta(seconds=self.stale_after)
+        stale = [GenerationJob.status == 'running', GenerationJob.heartbeat_at < cutoff]
+        db.session.execute(
+            update(GenerationJob)
+            .where(*stale, GenerationJob.attempts >= self.max_attempts)
+            .values(status='failed', error="Worker stopped responding", finished_at=datetime.utcnow())
+        )
+        db.session.execute(
+            update(GenerationJob)
+            .where(*stale, GenerationJob.attempts < self.max_attempts)
+            .values(status='queued')
+        )
+        db.session.commit()
+
+    def _run(self, job_id):
+        from ai.task_generator import stream_tasks_from_description  # ✅ Keeps the OpenAI client out of startup
+
+        job = db.session.get(GenerationJob, job_id)
+        print(f"🔄 Running generation job {job_id} for project {job.project_id}...")
+        try:
+            for event, data in stream_tasks_from_description(job.project_id):
+                if event == "task":
+                    job.tasks_parsed += 1
+                    job.heartbeat_at = datetime.utcnow()
+                elif event == "done":
+                    job.status = 'succeeded'
+                    job.result = json.dumps(data)
+                else:
+                    job.status = 'failed'
+                    job.error = data.get("error")
+                db.session.commit()
+        except Exception as e:
+            db.session.rollback()
+            job = db.session.get(GenerationJob, job_id)
+            job.status = 'failed'
+            job.error = f"Unexpected error: {str(e)}"
+
+        if job.status == 'running':
+            job.status = 'failed'
+            job.error = "Generation ended without a result"
+        job.finished_at = datetime.utcnow()
+        db.session.commit()
+        print(f"✅ Generation job {job_id} finished with status '{job.status}'")
+
+
+def serialize_job(job):
+    """JSON-friendly view of a job for the status endpoint."""
+    return {
+        "job_id": job.id,
+        "project_id": job.project_id,
+        "status": job.status,
+        "tasks_parsed": job.tasks_parsed,
+        "attempts": job.attempts,
+        "result": json.loads(job.result) if job.result else None,
+        "error": job.error,
+        "created_at": job.created_at,
+        "started_at": job.started_at,
+        "finished_at": job.finished_at,
+    }
+
+
+# ✅ Shared queue used by the generate endpoint
+generation_job_queue = GenerationJobQueue(
+    workers=Config.GENERATION_WORKERS,
+    poll_interval=Config.GENERATION_JOB_POLL_INTERVAL,
+    stale_after=Config.GENERATION_JOB_STALE_AFTER
+)
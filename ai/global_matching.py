@@ -0,0 +1,83 @@
+import numpy as np
+from scipy import sparse
+from scipy.optimize import linear_sum_assignment
+
+
+def score_matrix(employee_skill_tokens, subtask_words):
+    """Vectorized ``match_score`` for every employee × subtask pair.
+
+    ``employee_skill_tokens`` holds one list of per-skill token sets per
+    employee and ``subtask_words`` one token set per subtask. Returns an
+    integer array of shape (employees, subtasks) counting, for each pair,
+    the employee's skills that share at least one token with the subtask.
+    """
+    vocabulary = {}
+    skill_rows, skill_cols, skill_owner = [], [], []
+    for employee_index, skill_tokens in enumerate(employee_skill_tokens):
+        for tokens in skill_tokens:
+            for token in tokens:
+                skill_rows.append(len(skill_owner))
+                skill_cols.append(vocabulary.setdefault(token, len(vocabulary)))
+            skill_owner.append(employee_index)
+
+    subtask_rows, subtask_cols = [], []
+    for subtask_index, words in enumerate(subtask_words):
+        for word in words:
+            if word in vocabulary:
+                subtask_rows.append(subtask_index)
+                subtask_cols.append(vocabulary[word])
+
+    shape = (len(skill_owner), len(vocabulary))
+    skills = sparse.csr_matrix((np.ones(len(skill_rows)), (skill_rows, skill_cols)), shape=shape)
+    subtasks = sparse.csr_matrix(
+        (np.ones(len(subtask_rows)), (subtask_rows, subtask_cols)),
+        shape=(len(subtask_words), len(vocabulary))
+    )
+
+    #  skill × subtask: does the skill share any token with the subtask?
+    hits = (skills @ subtasks.T).tocsr()
+    hits.data[:] = 1
+
+    #  Sum the matching skills of each employee
+    grouping = sparse.csr_matrix(
+        (np.ones(len(skill_owner)), (skill_owner, np.arange(len(skill_owner)))),
+        shape=(len(employee_skill_tokens), len(skill_owner))
+    )
+    return (grouping @ hits).toarray().astype(np.int32)
+
+
+def solve_global_assignment(free_employees, candidates):
+    """Match employees to subtasks maximizing the total match score.
+
+    ``free_employees`` is a list of ``(employee, free_slots, skill_tokens)``;
+    each employee is expanded into ``free_slots`` rows so ``max_capacity`` is
+    respected. ``candidates`` maps subtask id to ``(subtask, project_id, words)``.
+    Returns ``(employee, subtask_id)`` pairs with a positive score.
+    """
+    subtask_ids = sorted(candidates)
+    if not free_employees or not subtask_ids:
+        return []
+
+    scores = score_matrix(
+        [skill_tokens for _, _, skill_tokens in free_employees],
+        [candidates[subtask_id][2] for subtask_id in subtask_ids]
+    )
+
+    #  Drop subtasks nobody matches and employees matching nothing
+    useful_subtasks = np.flatnonzero(scores.max(axis=0) > 0)
+    useful_employees = np.flatnonzero(scores.max(axis=1) > 0)
+    if not len(useful_subtasks) or not len(useful_employees):
+        return []
+    scores = scores[np.ix_(useful_employees, useful_subtasks)]
+
+    slots = np.array([free_employees[i][1] for i in useful_employees])
+    slot_owner = np.repeat(np.arange(len(useful_employees)), slots)
+    slot_scores = scores[slot_owner]
+
+    rows, cols = linear_sum_assignment(slot_scores, maximize=True)
+    keep = slot_scores[rows, cols] > 0
+
+    return [
+        (free_employees[useful_employees[slot_owner[row]]][0], subtask_ids[useful_subtasks[col]])
+        for row, col in zip(rows[keep], cols[keep])
+    ]
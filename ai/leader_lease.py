@@ -0,0 +1,66 @@
+import os
+import socket
+import uuid
+from datetime import datetime, timedelta
+from sqlalchemy import or_, update
+from sqlalchemy.exc import IntegrityError
+from database.db import db
+from models.scheduler_lease import SchedulerLease
+
+
+class LeaderLease:
+    """Leader election through a lease row in ``scheduler_leases``.
+
+    Every process calls ``renew`` periodically. The holder extends the lease;
+    anyone else takes it over only once it has expired, so a crashed leader is
+    replaced after at most ``ttl`` seconds. Both steps are single conditional
+    statements, which makes this work on MySQL and SQLite alike.
+    """
+
+    def __init__(self, name, ttl=30):
+        self.name = name
+        self.ttl = ttl
+        self.holder = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.is_leader = False
+
+    def renew(self):
+        """Acquire or extend the lease; returns whether this process is the leader."""
+        now = datetime.utcnow()
+        expires_at = now + timedelta(seconds=self.ttl)
+        try:
+            acquired = db.session.execute(
+                update(SchedulerLease)
+                .where(
+                    SchedulerLease.name == self.name,
+                    or_(SchedulerLease.holder == self.holder, SchedulerLease.expires_at < now)
+                )
+                .values(holder=self.holder, expires_at=expires_at)
+            ).rowcount == 1
+            if not acquired and db.session.get(SchedulerLease, self.name) is None:
+                db.session.add(SchedulerLease(name=self.name, holder=self.holder, expires_at=expires_at))
+                db.session.flush()
+                acquired = True
+            db.session.commit()
+        except IntegrityError:
+            db.session.rollback()  # ✅ Another process created the row first
+            acquired = False
+
+        if acquired != self.is_leader:
+            print(f"{'👑 Acquired' if acquired else '⚠️ Lost'} '{self.name}' lease ({self.holder})")
+        self.is_leader = acquired
+        return acquired
+
+    def release(self):
+        """Give up the lease so another process can take over without waiting for expiry."""
+        if not self.is_leader:
+            return
+        self.is_leader = False
+        try:
+            db.session.execute(
+                update(SchedulerLease)
+                .where(SchedulerLease.name == self.name, SchedulerLease.holder == self.holder)
+                .values(expires_at=datetime.utcnow())
+            )
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
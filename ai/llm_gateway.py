@@ -0,0 +1,216 @@
+import asyncio
+import queue
+import random
+import threading
+import time
+import openai
+from config import Config
+
+#  Errors worth retrying: throttling, server-side failures and transport problems
+RETRYABLE_ERRORS = (openai.RateLimitError, openai.InternalServerError, openai.APIConnectionError)
+
+
+class TokenBucket:
+    """Async token bucket: ``rate`` requests per second with bursts up to ``capacity``."""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class LLMGateway:
+    """Single entry point for chat completions.
+
+    Owns one ``AsyncOpenAI`` client whose pooled HTTP connections live on a
+    private event loop thread, so Flask request threads and background
+    workers share keep-alive connections. Every call waits for a token from
+    the rate limiter and a slot under ``max_in_flight``, and retries 429/5xx
+    and connection errors with exponential backoff and jitter, honouring
+    ``Retry-After`` when the provider sends it.
+
+    Async code awaits ``acomplete``/``astream``/``acomplete_many``; sync code
+    uses ``complete``/``stream``/``complete_many``, which run on the gateway
+    loop and block the calling thread only.
+    """
+
+    def __init__(self, api_key=None, timeout=60.0, connect_timeout=5.0, max_retries=5,
+                 backoff_base=0.5, backoff_max=20.0, max_in_flight=4,
+                 rate_limit=2.0, rate_limit_burst=5, max_connections=20):
+        self.api_key = api_key
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_in_flight = max_in_flight
+        self.rate_limit = rate_limit
+        self.rate_limit_burst = rate_limit_burst
+        self.max_connections = max_connections
+        self._loop = None
+        self._lock = threading.Lock()
+
+    def _ensure_loop(self):
+        """Start the gateway event loop thread and build the client on it (once)."""
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="llm-gateway", daemon=True).start()
+                asyncio.run_coroutine_threadsafe(self._setup(), loop).result()
+                self._loop = loop
+        return self._loop
+
+    async def _setup(self):
+        self.client = openai.AsyncOpenAI(
+            api_key=self.api_key,
+            timeout=openai.Timeout(self.timeout, connect=self.connect_timeout),
+            max_retries=0,  # ✅ Backoff is handled here so it also covers the rate limiter
+            #  Limits class of whichever httpx flavour the installed SDK is built on
+            http_client=openai.DefaultAsyncHttpxClient(
+                limits=type(openai.DEFAULT_CONNECTION_LIMITS)(
+                    max_connections=self.max_connections, max_keepalive_connections=self.max_connections
+                )
+            ),
+        )
+        self._in_flight = asyncio.Semaphore(self.max_in_flight)
+        self._bucket = TokenBucket(self.rate_limit, self.rate_limit_burst)
+
+    def _retry_delay(self, attempt, error):
+        """Seconds to wait before retry ``attempt`` (1-based)."""
+        response = getattr(error, "response", None)
+        retry_after = response.headers.get("retry-after") if response is not None else None
+        if retry_after:
+            try:
+                return min(float(retry_after), self.backoff_max)
+            except ValueError:
+                pass
+        delay = min(self.backoff_base * 2 ** (attempt - 1), self.backoff_max)
+        return delay * (0.5 + random.random() / 2)
+
+    async def _create(self, **kwargs):
+        """``chat.completions.create`` under the rate limiter, concurrency cap and retry policy."""
+        attempt = 0
+        while True:
+            await self._bucket.acquire()
+            try:
+                async with self._in_flight:
+                    return await self.client.chat.completions.create(**kwargs)
+            except RETRYABLE_ERRORS as e:
+                attempt += 1
+                if attempt > self.max_retries:
+                    raise
+                delay = self._retry_delay(attempt, e)
+                print(f"⚠️ LLM call failed ({e.__class__.__name__}), retry {attempt}/{self.max_retries} in {delay:.2f}s")
+                await asyncio.sleep(delay)
+
+    async def acomplete(self, messages, model, temperature):
+        """Return the text of a single completion."""
+        response = await self._create(model=model, messages=messages, temperature=temperature)
+        return response.choices[0].message.content.strip()
+
+    async def astream(self, messages, model, temperature):
+        """Yield content deltas of a streamed completion.
+
+        Opening the stream is retried like ``_create``: every attempt takes a
+        new token and slot, and the slot is released during the backoff. An
+        error after content has been yielded propagates to the caller.
+        """
+        attempt = 0
+        while True:
+            await self._bucket.acquire()
+            async with self._in_flight:
+                try:
+                    stream = await self.client.chat.completions.create(
+                        model=model, messages=messages, temperature=temperature, stream=True
+                    )
+                except RETRYABLE_ERRORS as e:
+                    attempt += 1
+                    if attempt > self.max_retries:
+                        raise
+                    error, delay = e, self._retry_delay(attempt, e)
+                else:
+                    try:
+                        async for chunk in stream:
+                            content = chunk.choices[0].delta.content if chunk.choices else None
+                            if content:
+                                yield content
+                    finally:
+                        await stream.close()  # ✅ Frees the connection when the consumer stops early
+                    return
+            print(f"⚠️ LLM stream failed to open ({error.__class__.__name__}), retry {attempt}/{self.max_retries} in {delay:.2f}s")
+            await asyncio.sleep(delay)
+
+    async def acomplete_many(self, message_lists, model, temperature):
+        """Run several completions concurrently; failures are returned in place of the text."""
+        return await asyncio.gather(
+            *(self.acomplete(messages, model, temperature) for messages in message_lists),
+            return_exceptions=True
+        )
+
+    def complete(self, messages, model, temperature):
+        return asyncio.run_coroutine_threadsafe(
+            self.acomplete(messages, model, temperature), self._ensure_loop()
+        ).result()
+
+    def complete_many(self, message_lists, model, temperature):
+        return asyncio.run_coroutine_threadsafe(
+            self.acomplete_many(message_lists, model, temperature), self._ensure_loop()
+        ).result()
+
+    def stream(self, messages, model, temperature):
+        """Blocking iterator over ``astream`` for sync callers.
+
+        Closing the iterator early (e.g. an SSE client disconnecting) cancels
+        the stream, so it stops consuming tokens and frees its slot.
+        """
+        chunks = queue.Queue()
+        done = object()
+
+        async def pump():
+            try:
+                async for content in self.astream(messages, model, temperature):
+                    chunks.put(content)
+            except Exception as e:
+                chunks.put(e)
+            finally:
+                chunks.put(done)
+
+        future = asyncio.run_coroutine_threadsafe(pump(), self._ensure_loop())
+        try:
+            while True:
+                item = chunks.get()
+                if item is done:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            future.cancel()
+
+
+# ✅ Shared gateway for every LLM call in the app
+llm_gateway = LLMGateway(
+    api_key=Config.OPENAI_API_KEY,
+    timeout=Config.LLM_TIMEOUT,
+    connect_timeout=Config.LLM_CONNECT_TIMEOUT,
+    max_retries=Config.LLM_MAX_RETRIES,
+    backoff_base=Config.LLM_BACKOFF_BASE,
+    backoff_max=Config.LLM_BACKOFF_MAX,
+    max_in_flight=Config.LLM_MAX_IN_FLIGHT,
+    rate_limit=Config.LLM_RATE_LIMIT,
+    rate_limit_burst=Config.LLM_RATE_LIMIT_BURST,
+    max_connections=Config.LLM_MAX_CONNECTIONS
+)
@@ -0,0 +1,62 @@
+import re
+from collections import defaultdict
+from sqlalchemy import delete, insert
+from database.db import db
+from models.task import Subtask
+from models.subtask_token import SubtaskToken
+
+#  Words that appear in almost every subtask name and carry no skill signal
+STOPWORDS = {"a", "an", "and", "as", "for", "from", "in", "into", "of", "on", "or", "the", "to", "with"}
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9+#]+")
+
+
+def parse_skills(skills):
+    """Split a comma-separated skills string into a set of normalized skills."""
+    return set(skill.strip().lower()[:100] for skill in (skills or "").split(",") if skill.strip())
+
+
+def tokenize(text):
+    """Split free text (a skill or a subtask name) into normalized matching tokens."""
+    return {
+        token[:100] for token in TOKEN_PATTERN.findall((text or "").lower())
+        if token not in STOPWORDS
+    }
+
+
+def index_subtasks(subtasks):
+    """Add postings for open subtasks. Caller commits."""
+    rows = [
+        {"token": token, "subtask_id": subtask.id}
+        for subtask in subtasks
+        for token in tokenize(subtask.name)
+    ]
+    if rows:
+        db.session.execute(insert(SubtaskToken), rows)
+
+
+def unindex_subtasks(subtask_ids):
+    """Drop the postings of subtasks that are no longer open. Caller commits."""
+    subtask_ids = list(subtask_ids)
+    if subtask_ids:
+        db.session.execute(delete(SubtaskToken).where(SubtaskToken.subtask_id.in_(subtask_ids)))
+
+
+def lookup_postings(tokens):
+    """Return ``{token: set(subtask_id)}`` for the given tokens in one indexed query."""
+    postings = defaultdict(set)
+    tokens = list(tokens)
+    if tokens:
+        rows = db.session.query(SubtaskToken.token, SubtaskToken.subtask_id).filter(SubtaskToken.token.in_(tokens))
+        for token, subtask_id in rows:
+            postings[token].add(subtask_id)
+    return postings
+
+
+def rebuild_index():
+    """Recreate the whole index from the currently open subtasks."""
+    db.session.execute(delete(SubtaskToken))
+    open_subtasks = Subtask.query.filter_by(status=0, employee_id=None).all()
+    index_subtasks(open_subtasks)
+    db.session.commit()
+    return len(open_subtasks)
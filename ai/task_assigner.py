@@ -2,126 +2,251 @@ from database.db import db
 from models.assignment import Assignment
 from models.task import Task, Subtask, Milestone
 from models.employee import Employee
-import time
-from models.logs import AssignmentLog
+from ai.assignment_log_writer import assignment_log_writer
+from config import Config
+from sqlalchemy import and_, case, exists, func, insert, or_, true, update
+from sqlalchemy.exc import SQLAlchemyError
+from ai.skill_index import tokenize, lookup_postings, unindex_subtasks
+from controllers.reference_cache import employee_cache
+from controllers.workload_controller import record_assignments
+from ai.change_feed import change, record_changes
 
 def log_assignment(employee_id, message):
-    """Store assignment log messages in the database."""
-    log_entry = AssignmentLog(employee_id=employee_id, log_message=message)
-    db.session.add(log_entry)
-    db.session.commit()
-    print(f"📝 Log stored: {message}")
-
+    """Queue an assignment log message; it is bulk-inserted by the background log writer."""
+    assignment_log_writer.write(employee_id, message)
+    print(f"📝 Log queued: {message}")
+
+
+
+def subtask_assigned_change(employee, subtask, project_id):
+    """Change event pushed to dashboards when a subtask is assigned."""
+    return change("subtask_assigned", {
+        "subtask_id": subtask.id, "subtask_name": subtask.name, "task_id": subtask.task_id,
+        "employee_id": employee.id, "employee_name": employee.name
+    }, project_id, employee.id)
+
+
+def match_score(skill_tokens, words):
+    """Count how many skills share at least one token with the subtask name."""
+    return sum(1 for tokens in skill_tokens if tokens & words)
+
+
+def best_matching_candidate(skill_tokens, candidates, postings):
+    """Return the id of the highest scoring candidate, or None when nothing matches.
+
+    Only subtasks listed in ``postings`` under one of the employee's tokens are
+    scored. ``candidates`` maps subtask id to ``(subtask, project_id, words)``;
+    ties go to the lowest subtask id.
+    """
+    candidate_ids = set()
+    for tokens in skill_tokens:
+        for token in tokens:
+            candidate_ids.update(postings.get(token, ()))
+
+    best_id = None
+    highest_match_score = 0
+    for subtask_id in sorted(candidate_ids):
+        candidate = candidates.get(subtask_id)
+        if candidate is None:
+            continue  # ✅ Already taken earlier in this pass
+        score = match_score(skill_tokens, candidate[2])
+        if score > highest_match_score:
+            best_id = subtask_id
+            highest_match_score = score
+    return best_id
+
+
+def claim_subtask(subtask, employee_id):
+    """Atomically claim an open subtask for an employee.
+
+    The conditional UPDATE only matches while the subtask is still open and at
+    the version that was read, so when several workers race for the same
+    subtask exactly one of them gets ``True``.
+    """
+    result = db.session.execute(
+        update(Subtask)
+        .where(
+            Subtask.id == subtask.id,
+            Subtask.version == subtask.version,
+            Subtask.status == 0,
+            Subtask.employee_id.is_(None)
+        )
+        .values(employee_id=employee_id, status=1, version=Subtask.version + 1)  # ✅ Mark as Assigned
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount == 1
 
 
 # AI Task Assignment Agent
 class AITaskAssignmentAgent:
-    def __init__(self, max_capacity=1):
+    def __init__(self, max_capacity=1, mode="greedy"):
         self.max_capacity = max_capacity  # Max subtasks an employee can handle at once
-
-    def assign_tasks(self):
-        """Assign subtasks dynamically using AI logic based on employee skills."""
-        
-        available_employees = Employee.query.all()
-
+        self.mode = mode  # "greedy" (first come, first served) or "global" (optimal matching)
+
+    def assign_tasks(self, mode=None, employee_ids=None, subtask_ids=None):
+        """Assign subtasks dynamically using AI logic based on employee skills.
+
+        Employees, open subtasks and active assignments are loaded once, the
+        matching is computed in memory and every subtask, assignment and
+        milestone change is written in a single transaction. ``mode`` overrides
+        the agent's matching mode ("greedy" or "global") for this pass.
+        ``employee_ids`` / ``subtask_ids`` restrict the pass to those employees
+        or candidate subtasks.
+        """
+        if employee_ids is None:
+            employee_ids = [employee_id for (employee_id,) in db.session.query(Employee.id).order_by(Employee.id)]
+        else:
+            employee_ids = sorted(employee_ids)
+        # ✅ Names and tokenized skills come from the employee cache
+        employees_by_id = employee_cache.get_many(employee_ids)
+        available_employees = [employees_by_id[employee_id] for employee_id in employee_ids if employee_id in employees_by_id]
+
+        # ✅ Number of subtasks each employee is currently working on
+        active_counts = {
+            str(employee_id): count
+            for employee_id, count in db.session.query(Assignment.employee_id, func.count(Assignment.id))
+            .filter(Assignment.status == 1)
+            .group_by(Assignment.employee_id)
+            .all()
+        }
+
+        # ✅ Employees with a free slot and their tokenized skills
+        free_employees = []
         for employee in available_employees:
-            # ✅ Check if employee is already working on a subtask
-            active_assignment = Assignment.query.filter_by(employee_id=employee.id, status=1).first()
-
-            if active_assignment:
+            free_slots = self.max_capacity - active_counts.get(str(employee.id), 0)
+            if free_slots <= 0:
                 print(f"⏳ Employee {employee.id} is still working on a task. Waiting for completion.")
                 continue  # ✅ Skip assigning a new subtask until current one is completed
-
-            # ✅ Find the best matching subtask for this employee
-            matching_subtask = self.find_best_matching_subtask(employee)
-
-            if not matching_subtask:
-                print(f"⚠️ No matching subtasks found for Employee {employee.id}.")
-                continue  
-
-            # ✅ Get the project ID from the associated Task
-            project = db.session.get(Task, matching_subtask.task_id)
-            project_id = project.project_id if project else None
-
-            if not project_id:
-                print(f"⚠️ Could not find a project for subtask {matching_subtask.id}. Skipping.")
-                continue  # Skip this subtask if no project is found
-
-            # ✅ Assign the subtask to the employee
-            matching_subtask.employee_id = employee.id
-            matching_subtask.status = 1  # ✅ Mark as Assigned
-            db.session.commit()
-
-            # ✅ Create an assignment record
-            assignment_entry = Assignment(
-                employee_id=employee.id,
-                project_id=project_id,  # ✅ Correct project_id
-                subtask_id=matching_subtask.id,
-                status=1  # ✅ Task in Progress
+            free_employees.append((employee, free_slots))
+
+        free_employees = [(employee, free_slots, list(employee.skill_tokens)) for employee, free_slots in free_employees]
+
+        # ✅ Only subtasks sharing a token with some free employee are loaded
+        postings = lookup_postings({token for _, _, skill_tokens in free_employees for tokens in skill_tokens for token in tokens})
+        candidate_ids = set().union(*postings.values())
+        if subtask_ids is not None:
+            candidate_ids &= set(subtask_ids)
+        open_subtasks = []
+        if candidate_ids:
+            open_subtasks = (
+                db.session.query(Subtask, Task.project_id)
+                .join(Task, Subtask.task_id == Task.id)
+                .filter(Subtask.id.in_(candidate_ids), Subtask.status == 0, Subtask.employee_id.is_(None))
+                .all()
             )
-            db.session.add(assignment_entry)
-            db.session.commit()
-
-            print(f"✅ Assigned Subtask '{matching_subtask.name}' to {employee.name} (Employee ID: {employee.id})")
-
-            # ✅ Assign milestones **only after subtask assignment**
-            self.assign_milestones_to_employee(matching_subtask.id, employee.id)
-
-        return {"message": "Subtasks assigned successfully!"}
-
-    def find_best_matching_subtask(self, employee):
-        """Find the best available subtask for an employee based on skills."""
-        
-        employee_skills = set(skill.strip().lower() for skill in employee.skills.split(","))  # ✅ Normalize skills
-        available_subtasks = Subtask.query.filter_by(status=0, employee_id=None).all()  # ✅ Fetch all unassigned subtasks
-
-        best_match = None
-        highest_match_score = 0
+        candidates = {
+            subtask.id: (subtask, project_id, tokenize(subtask.name))
+            for subtask, project_id in open_subtasks
+        }
 
-        for subtask in available_subtasks:
-            subtask_words = set(subtask.name.lower().split())  # ✅ Split subtask name into words
-
-            # ✅ Calculate match score: Count how many skill words appear in the subtask name
-            match_score = sum(1 for skill in employee_skills if skill in subtask_words or any(word in skill for word in subtask_words))
-
-            # ✅ Select the subtask with the highest match score
-            if match_score > highest_match_score:
-                best_match = subtask
-                highest_match_score = match_score
-        print(f"🔍 Checking available subtasks for Employee {employee.id} ({employee.name}):")
-        for subtask in available_subtasks:
-            print(f"📌 Subtask: {subtask.name}")
-
-        if best_match:
-            print(f"✅ Best match for {employee.name}: {best_match.name}")
+        if (mode or self.mode) == "global":
+            plan = self.plan_global_assignment(free_employees, candidates)
         else:
-            print(f"⚠️ No suitable subtask found for Employee {employee.name}")
-
-        return best_match  # ✅ Return the best-matching subtask
-
-
-    def assign_milestones_to_employee(self, subtask_id, employee_id):
-        """Assign all milestones of a subtask to the same employee working on the subtask."""
-        milestones = Milestone.query.filter_by(subtask_id=subtask_id, employee_id=None).all()
-
-        for milestone in milestones:
-            milestone.employee_id = employee_id
-            milestone.status = 0  # ✅ Set as "Not Started"
+            plan = self.plan_greedy_assignment(free_employees, candidates, postings)
+
+        if not plan:
+            print("⚠️ No matching subtasks found for any available employee.")
+            return {"message": "Subtasks assigned successfully!", "assigned": 0}
+
+        try:
+            # ✅ Claim each subtask atomically; concurrent passes may have taken some
+            claimed = []
+            for employee, subtask, project_id in plan:
+                if claim_subtask(subtask, employee.id):
+                    claimed.append((employee, subtask, project_id))
+                else:
+                    print(f"⚠️ Subtask {subtask.id} was claimed by another worker. Skipping.")
+            plan = claimed
+
+            if plan:
+                # ✅ Milestones of every claimed subtask, fetched in one query
+                owner_by_subtask = {subtask.id: employee.id for employee, subtask, _ in plan}
+                milestone_rows = db.session.query(Milestone.id, Milestone.subtask_id).filter(
+                    Milestone.subtask_id.in_(list(owner_by_subtask)),
+                    Milestone.employee_id.is_(None)
+                ).all()
+
+                # ✅ Write the rest of the plan as executemany batches in the same transaction
+                db.session.execute(insert(Assignment), [
+                    {"employee_id": employee.id, "project_id": project_id, "subtask_id": subtask.id, "status": 1}  # ✅ Task in Progress
+                    for employee, subtask, project_id in plan
+                ])
+                if milestone_rows:
+                    db.session.execute(update(Milestone), [
+                        {"id": milestone_id, "employee_id": owner_by_subtask[subtask_id], "status": 0}  # ✅ Set as "Not Started"
+                        for milestone_id, subtask_id in milestone_rows
+                    ])
+                unindex_subtasks(owner_by_subtask)
+                record_assignments([(employee.id, subtask, project_id) for employee, subtask, project_id in plan])
+                record_changes(subtask_assigned_change(employee, subtask, project_id) for employee, subtask, project_id in plan)
+            # ✅ Built before the commit expires the subtasks, so printing them doesn't reload each one
+            assigned = [f"✅ Assigned Subtask '{subtask.name}' to {employee.name} (Employee ID: {employee.id})" for employee, subtask, _ in plan]
             db.session.commit()
+        except SQLAlchemyError as e:
+            db.session.rollback()
+            print(f"⚠️ Assignment pass rolled back: {e}")
+            return {"error": f"Assignment failed: {str(e)}"}
+
+        for message in assigned:
+            print(message)
+
+        return {"message": "Subtasks assigned successfully!", "assigned": len(plan)}
+
+    def plan_greedy_assignment(self, free_employees, candidates, postings):
+        """Let each employee, in order, take their best remaining subtasks."""
+        plan = []  # (employee, subtask, project_id)
+        for employee, free_slots, skill_tokens in free_employees:
+            for _ in range(free_slots):
+                best_id = best_matching_candidate(skill_tokens, candidates, postings)
+                if best_id is None:
+                    break
+                subtask, project_id, _words = candidates.pop(best_id)
+                plan.append((employee, subtask, project_id))
+        return plan
+
+    def plan_global_assignment(self, free_employees, candidates):
+        """Solve the employee × subtask matching maximizing the total match score."""
+        from ai.global_matching import solve_global_assignment  # ✅ NumPy/SciPy only needed in this mode
+
+        plan = []  # (employee, subtask, project_id)
+        for employee, subtask_id in solve_global_assignment(free_employees, candidates):
+            subtask, project_id, _words = candidates.pop(subtask_id)
+            plan.append((employee, subtask, project_id))
+        return plan
 
-            print(f"✅ Assigned Milestone '{milestone.milestone_name}' to Employee {employee_id}")
+    def assign_milestones_to_employee(self, subtask_id, employee_id):
+        """Assign all milestones of a subtask to the same employee working on the subtask. Caller commits."""
+        result = db.session.execute(
+            update(Milestone)
+            .where(Milestone.subtask_id == subtask_id, Milestone.employee_id.is_(None))
+            .values(employee_id=employee_id, status=0)  # ✅ Set as "Not Started"
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
 
     def check_and_update_task_status(self):
-        """Checks if all subtasks of a task are completed and updates the task status."""
-        all_tasks = Task.query.all()
-
-        for task in all_tasks:
-            subtasks = Subtask.query.filter_by(task_id=task.id).all()
-
-            if all(subtask.status == 1 for subtask in subtasks):  
-                task.status = 1  # ✅ Mark task as Completed
-                db.session.commit()
-                print(f"✅ Task '{task.name}' is now marked as completed!")
+        """Checks if all subtasks of a task are completed and updates the task status.
+
+        Only tasks flagged ``needs_rollup`` (new, or touched since the last run)
+        are evaluated, with a single set-based UPDATE that also clears the flag.
+        """
+        # ✅ Finished as the completion counters define it: has milestones, all completed (status 1 also means assigned)
+        incomplete_subtask = exists().where(
+            Subtask.task_id == Task.id,
+            or_(Subtask.total_milestones == 0, Subtask.completed_milestones < Subtask.total_milestones)
+        )
+        completed_now = and_(or_(Task.status != 1, Task.status.is_(None)), ~incomplete_subtask)
+
+        result = db.session.execute(
+            update(Task)
+            .where(Task.needs_rollup == true())
+            .ordered_values(
+                (Task.status, case((completed_now, 1), else_=Task.status)),  # ✅ Mark task as Completed
+                (Task.needs_rollup, False),
+            )
+        )
+        db.session.commit()
+        print(f"✅ Rolled up {result.rowcount} touched tasks.")
 
         return {"message": "Task status updated successfully!"}
     
@@ -131,61 +256,50 @@ class AITaskAssignmentAgent:
         
         print(f"🔄 Checking for new subtasks for Employee {employee_id}...")
 
-        employee = Employee.query.get(employee_id)
+        employee = employee_cache.get(int(employee_id))
         if not employee:
             log_assignment(employee_id, f"⚠️ Employee {employee_id} not found!")
             return {"error": "Employee not found."}
 
-        employee_skills = [skill.strip().lower() for skill in employee.skills.split(",")]
+        employee_skills = sorted(employee.skill_set)
         log_assignment(employee_id, f"👨‍💻 Employee {employee.name} has skills: {employee_skills}")
 
-        available_subtasks = Subtask.query.filter_by(status=0, employee_id=None).all()
-        log_assignment(employee_id, f"🔍 Found {len(available_subtasks)} unassigned subtasks.")
+        # ✅ Only subtasks sharing a skill token with the employee are candidates
+        postings = lookup_postings({token for skill in employee_skills for token in tokenize(skill)})
+        candidate_ids = set().union(*postings.values())
+        available_subtasks = Subtask.query.filter(
+            Subtask.id.in_(candidate_ids), Subtask.status == 0, Subtask.employee_id.is_(None)
+        ).order_by(Subtask.id).all() if candidate_ids else []
+        log_assignment(employee_id, f"🔍 Found {len(available_subtasks)} unassigned subtasks matching the employee's skills.")
 
-        for subtask in available_subtasks:
-            subtask_name = subtask.name.lower()
+        for subtask in available_subtasks:  # ✅ Oldest matching subtask first
+            if not claim_subtask(subtask, employee.id):
+                continue  # ✅ Taken by a concurrent assignment, try the next one
 
-            if any(skill in subtask_name for skill in employee_skills):
-                subtask.employee_id = employee.id
-                subtask.status = 1  # ✅ Mark as Assigned
-                db.session.commit()
+            task = db.session.get(Task, subtask.task_id)
 
-                task = db.session.get(Task, subtask.task_id)
-
-                assignment_entry = Assignment(
-                    employee_id=employee.id,
-                    project_id=task.project_id,
-                    subtask_id=subtask.id,
-                    status=1  
-                )
-                db.session.add(assignment_entry)
-                db.session.commit()
-
-                log_assignment(employee_id, f"✅ Assigned Subtask '{subtask.name}' to {employee.name} (Employee ID: {employee.id})")
+            assignment_entry = Assignment(
+                employee_id=employee.id,
+                project_id=task.project_id,
+                subtask_id=subtask.id,
+                status=1  
+            )
+            db.session.add(assignment_entry)
+            # ✅ Milestones follow the subtask in the same transaction, as in assign_tasks
+            milestone_count = self.assign_milestones_to_employee(subtask.id, employee.id)
+            unindex_subtasks([subtask.id])
+            record_assignments([(employee.id, subtask, task.project_id)])
+            record_changes([subtask_assigned_change(employee, subtask, task.project_id)])
+            db.session.commit()
 
-                # ✅ Assign all milestones only after subtask assignment
-                self.assign_milestones_to_employee(subtask.id, employee.id)
+            log_assignment(employee_id, f"✅ Assigned Subtask '{subtask.name}' to {employee.name} (Employee ID: {employee.id})")
+            print(f"✅ Assigned {milestone_count} milestones of Subtask {subtask.id} to Employee {employee.id}")
 
-                return {"message": f"New subtask '{subtask.name}' assigned to {employee.name}."}
+            return {"message": f"New subtask '{subtask.name}' assigned to {employee.name}."}
 
         log_assignment(employee_id, f"⚠️ No suitable subtasks found for Employee {employee_id} with skills {employee_skills}.")
         return {"message": "No matching subtasks available for this employee."}
 
     
 # ✅ AI Agent Instance
-ai_task_agent = AITaskAssignmentAgent()
-
-def assign_tasks_periodically():
-    """Periodically assigns subtasks and milestones to employees using AI logic."""
-    
-    while True:
-        print("🔄 Assigning tasks using AI agent...")
-        ai_task_agent.assign_tasks()
-        ai_task_agent.check_and_update_task_status()
-
-        # ✅ Assign new subtasks to employees who completed their previous one
-        completed_employees = Assignment.query.filter_by(status=1).all()
-        for assignment in completed_employees:
-            ai_task_agent.assign_next_subtask_to_employee(assignment.employee_id)
-
-        time.sleep(60)  # ✅ Runs every 60 seconds
+ai_task_agent = AITaskAssignmentAgent(mode=Config.TASK_ASSIGNMENT_MODE)
@@ -1,26 +1,43 @@
 import openai
 import re
+from sqlalchemy import insert
 from database.db import db
-from models.project import Project
 from models.task import Task, Subtask, Milestone
 from config import Config
-from ai.task_assigner import ai_task_agent  # Use AI agent for assignment
+from ai.assignment_scheduler import assignment_scheduler  # Assigns new subtasks in the background
+from ai.skill_index import index_subtasks
+from ai.completion_cache import CompletionCache, completion_cache_key
+from ai.llm_gateway import llm_gateway
+from ai.change_feed import change, record_changes
+from controllers.reference_cache import project_cache
 
-#  Initialize OpenAI Client
-client = openai.OpenAI(api_key=Config.OPENAI_API_KEY)
+TASK_MODEL = "gpt-3.5-turbo"
+TASK_TEMPERATURE = 0.6
+TASK_PROMPT_VERSION = 1  # Bump whenever build_task_prompt changes so cached breakdowns are not reused
+MAX_MILESTONES = 5
+GENERATED_MESSAGE = " Tasks, Subtasks, and Milestones generated; assignment queued."
 
-def generate_tasks_from_description(project_id):
-    """Uses OpenAI GPT-3.5 to analyze project description and generate structured tasks, subtasks, and milestones."""
-    
-    #  Fetch Project Details
-    project = Project.query.filter_by(project_id=project_id).first()
-    if not project:
-        return {"error": "Project not found"}, 404  
+TASK_PATTERN = re.compile(r"^\*\*(.*?)\*\*")
+SUBTASK_PATTERN = re.compile(r"^- (.+)")
+MILESTONE_PATTERN = re.compile(r"^\s+- (.+)")
 
-    description = project.description
-    
-    #  AI Prompt
-    prompt = f"""
+#  Raw completions keyed on (normalized description, prompt version, model, temperature)
+completion_cache = CompletionCache(
+    Config.LLM_CACHE_PATH,
+    ttl=Config.LLM_CACHE_TTL,
+    max_entries=Config.LLM_CACHE_MAX_ENTRIES,
+    enabled=Config.LLM_CACHE_ENABLED
+)
+
+
+def task_cache_key(description):
+    """Cache key of the breakdown generated for a project description."""
+    return completion_cache_key(description, TASK_PROMPT_VERSION, TASK_MODEL, TASK_TEMPERATURE)
+
+
+def build_task_prompt(description):
+    """Build the task breakdown prompt for a project description."""
+    return f"""
 You are an AI-powered project manager. Given a detailed project description, generate **realistic tasks, subtasks, and milestones** needed to complete the project.
 
 ### **Rules for Task Generation:**
@@ -54,72 +71,163 @@ You are an AI-powered project manager. Given a detailed project description, gen
 Now, generate the structured task breakdown for this project:
 """
 
-    try:
-        #  Generate AI Response
-        response = client.chat.completions.create(
-            model="gpt-3.5-turbo",
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.6,
-        )
-
-        tasks_text = response.choices[0].message.content.strip()
-
-        # Debugging: Print AI response
-        print(f"🔍 AI Response:\n{tasks_text}")
-
-        current_task = None  
-        current_subtask = None  
-        milestones = []
-        subtask_list = []  # Keep track of all created subtasks
-
-        for line in tasks_text.split("\n"):
-            print(f"🔍 Processing Line: {line}")
-
-            task_match = re.match(r"^\*\*(.*?)\*\*", line)  
-            subtask_match = re.match(r"^- (.+)", line)  
-            milestone_match = re.match(r"^\s+- (.+)", line)  
-
-            if task_match:
-                task_name = task_match.group(1).strip()
-                print(f"Task Detected: {task_name}")  
-
-                current_task = Task(name=task_name[:255], project_id=project_id, status=0)
-                db.session.add(current_task)
-                db.session.commit()  
-
-            elif subtask_match and current_task:
-                subtask_name = subtask_match.group(1).strip()
-                print(f" Subtask Detected: {subtask_name}")  
-
-                current_subtask = Subtask(
-                    name=subtask_name[:255], 
-                    task_id=current_task.id,  
-                    status=0  
+
+class TaskBreakdownParser:
+    """Incremental parser for the ``**Task**`` / ``- subtask`` / ``    - milestone`` format.
+
+    ``feed`` accepts arbitrary chunks of a (possibly streamed) completion and
+    returns the tasks completed so far; a task is complete once the next task
+    header arrives. ``close`` returns whatever is still open.
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._current_task = None
+        self._current_subtask = None
+
+    def feed(self, chunk):
+        self._buffer += chunk
+        *lines, self._buffer = self._buffer.split("\n")
+        return [task for task in map(self._parse_line, lines) if task]
+
+    def close(self):
+        completed = []
+        if self._buffer:
+            line, self._buffer = self._buffer, ""
+            task = self._parse_line(line)
+            if task:
+                completed.append(task)
+        if self._current_task:
+            completed.append(self._current_task)
+            self._current_task = None
+        return completed
+
+    def _parse_line(self, line):
+        """Consume one line; returns the previous task when a new one starts."""
+        task_match = TASK_PATTERN.match(line)
+        subtask_match = SUBTASK_PATTERN.match(line)
+        milestone_match = MILESTONE_PATTERN.match(line)
+
+        if task_match:
+            finished = self._current_task
+            self._current_task = {"name": task_match.group(1).strip()[:255], "subtasks": []}
+            self._current_subtask = None
+            return finished
+
+        if subtask_match and self._current_task:
+            self._current_subtask = {"name": subtask_match.group(1).strip()[:255], "milestones": []}
+            self._current_task["subtasks"].append(self._current_subtask)
+
+        elif milestone_match and self._current_subtask:
+            if len(self._current_subtask["milestones"]) < MAX_MILESTONES:
+                self._current_subtask["milestones"].append(milestone_match.group(1).strip()[:255])
+
+        return None
+
+
+def parse_task_breakdown(tasks_text):
+    """Parse the AI breakdown into an in-memory tree without touching the database.
+
+    Returns a list of ``{"name", "subtasks": [{"name", "milestones": [name, ...]}]}``.
+    """
+    parser = TaskBreakdownParser()
+    return parser.feed(tasks_text) + parser.close()
+
+
+def save_task_trees(trees):
+    """Add parsed trees (``{project_id: tree}``) to the session in as few INSERTs as the backend allows.
+
+    Tasks and subtasks go out in a single flush (batched with RETURNING where
+    the backend can keep row order), then all milestones in one executemany.
+    Nothing is committed: the caller owns the transaction, so a failure leaves
+    no half-written tree. Returns the created subtasks (with ids assigned).
+    """
+    tasks = []
+    subtasks = []  # (subtask, milestone names)
+    for project_id, tree in trees.items():
+        for task_data in tree:
+            task = Task(
+                name=task_data["name"], project_id=project_id, status=0,
+                total_subtasks=len(task_data["subtasks"]), completed_subtasks=0
+            )
+            for subtask_data in task_data["subtasks"]:
+                subtask = Subtask(
+                    name=subtask_data["name"], status=0,
+                    total_milestones=len(subtask_data["milestones"]), completed_milestones=0
                 )
-                db.session.add(current_subtask)
-                db.session.commit()
-                subtask_list.append(current_subtask)  #  Store for later assignment
-                milestones = []  
-
-            elif milestone_match and current_subtask:
-                milestone_name = milestone_match.group(1).strip()
-                if len(milestones) < 5:  
-                    print(f" Milestone Detected: {milestone_name}")  
-                    milestone_entry = Milestone(
-                        milestone_name=milestone_name[:255], 
-                        subtask_id=current_subtask.id,
-                        employee_id=None,  
-                        status=0  
-                    )
-                    db.session.add(milestone_entry)
-                    milestones.append(milestone_entry)
-
-        db.session.commit()
+                task.subtasks.append(subtask)
+                subtasks.append((subtask, subtask_data["milestones"]))
+            tasks.append(task)
+
+    db.session.add_all(tasks)
+    db.session.flush()  # ✅ Resolves task and subtask ids
+
+    milestone_rows = [
+        {"milestone_name": name, "subtask_id": subtask.id, "employee_id": None, "status": 0}
+        for subtask, names in subtasks
+        for name in names
+    ]
+    if milestone_rows:
+        db.session.execute(insert(Milestone), milestone_rows)
+
+    return [subtask for subtask, _ in subtasks]
+
+
+def store_generated_trees(trees):
+    """Persist parsed trees (``{project_id: tree}``) and index their subtasks in a single transaction."""
+    subtask_list = save_task_trees(trees)
+
+    #  Make the new subtasks discoverable by skill token
+    index_subtasks(subtask_list)
+    record_changes(change("tasks_generated", {"tasks": len(tree)}, project_id) for project_id, tree in trees.items())
+    db.session.commit()
+    for project_id, tree in trees.items():
+        print(f"✅ Stored {len(tree)} tasks for project {project_id}")
+    print(f"✅ Stored {len(subtask_list)} subtasks in total")
+    return subtask_list
+
+
+def store_generated_tree(project_id, tree):
+    """Persist a parsed tree and index its subtasks in a single transaction."""
+    return store_generated_trees({project_id: tree})
+
+
+def generate_tasks_from_description(project_id):
+    """Uses OpenAI GPT-3.5 to analyze project description and generate structured tasks, subtasks, and milestones."""
+    
+    #  Fetch Project Details
+    project = project_cache.get(project_id)
+    if not project:
+        return {"error": "Project not found"}, 404  
+
+    cache_key = task_cache_key(project.description)
+
+    try:
+        #  Reuse the breakdown of an identical description when we have one
+        tasks_text = completion_cache.get(cache_key)
+        cached = tasks_text is not None
+
+        if not cached:
+            #  Generate AI Response
+            tasks_text = llm_gateway.complete(
+                [{"role": "user", "content": build_task_prompt(project.description)}],
+                TASK_MODEL, TASK_TEMPERATURE
+            )
+
+        #  Parse the whole breakdown before writing anything
+        tree = parse_task_breakdown(tasks_text)
+        if not tree:
+            return {"error": "AI response did not contain any tasks"}, 500
+
+        if not cached:
+            completion_cache.put(cache_key, tasks_text)
+
+        subtask_list = store_generated_tree(project_id, tree)
 
         #  Assign only **ONE subtask per employee initially**
-        ai_task_agent.assign_tasks()
+        assignment_scheduler.notify_subtasks_created(subtask.id for subtask in subtask_list)
 
-        return {"message": " Tasks, Subtasks, and Milestones generated and assigned successfully!"}
+        return {"message": GENERATED_MESSAGE}
 
     except openai.OpenAIError as e:  
         db.session.rollback()
@@ -127,3 +235,130 @@ Now, generate the structured task breakdown for this project:
     except Exception as e:
         db.session.rollback()
         return {"error": f"Unexpected error: {str(e)}"}, 500
+
+
+def stream_tasks_from_description(project_id):
+    """Streaming variant of ``generate_tasks_from_description``.
+
+    Consumes the completion as a token stream and yields ``("task", task)`` as
+    soon as each task is fully parsed, then a single ``("done", result)`` once
+    the tree is stored and its assignment queued, or ``("error", result)``.
+    """
+    project = project_cache.get(project_id)
+    if not project:
+        yield "error", {"error": "Project not found"}
+        return
+
+    parser = TaskBreakdownParser()
+    tree = []
+    cache_key = task_cache_key(project.description)
+
+    try:
+        cached_text = completion_cache.get(cache_key)
+        if cached_text is not None:
+            chunks = [cached_text]
+        else:
+            chunks = llm_gateway.stream(
+                [{"role": "user", "content": build_task_prompt(project.description)}],
+                TASK_MODEL, TASK_TEMPERATURE
+            )
+
+        received = []
+        for content in chunks:
+            if not content:
+                continue
+            received.append(content)
+            for task in parser.feed(content):
+                tree.append(task)
+                yield "task", task
+
+        for task in parser.close():
+            tree.append(task)
+            yield "task", task
+
+        if not tree:
+            yield "error", {"error": "AI response did not contain any tasks"}
+            return
+
+        if cached_text is None:
+            completion_cache.put(cache_key, "".join(received).strip())
+
+        subtask_list = store_generated_tree(project_id, tree)
+        assignment_scheduler.notify_subtasks_created(subtask.id for subtask in subtask_list)
+
+        yield "done", {"message": GENERATED_MESSAGE, "tasks": len(tree)}
+
+    except openai.OpenAIError as e:
+        db.session.rollback()
+        yield "error", {"error": f"OpenAI API error: {str(e)}"}
+    except Exception as e:
+        db.session.rollback()
+        yield "error", {"error": f"Unexpected error: {str(e)}"}
+
+
+def generate_tasks_for_projects(project_ids):
+    """Batch variant of ``generate_tasks_from_description`` for many projects.
+
+    Cache misses are fanned out to the LLM concurrently (one call per distinct
+    description), every tree is stored in one transaction and a single
+    assignment pass runs at the end. Returns ``{project_id: result}``.
+    """
+    results = {}
+    projects = project_cache.get_many(project_ids)
+
+    texts = {}  # cache key -> completion text
+    keys = {}  # project id -> cache key
+    for project_id in project_ids:
+        project = projects.get(project_id)
+        if not project:
+            results[project_id] = {"error": "Project not found"}
+            continue
+        keys[project_id] = key = task_cache_key(project.description)
+        if key not in texts:
+            texts[key] = completion_cache.get(key)
+    cached_keys = {key for key, text in texts.items() if text is not None}
+
+    #  Identical descriptions share a single LLM call
+    pending = {}
+    for project_id, key in keys.items():
+        if texts[key] is None and key not in pending:
+            pending[key] = [{"role": "user", "content": build_task_prompt(projects[project_id].description)}]
+    if pending:
+        try:
+            completions = llm_gateway.complete_many(list(pending.values()), TASK_MODEL, TASK_TEMPERATURE)
+        except Exception as e:
+            completions = [e] * len(pending)  #  e.g. no API key configured: every pending project reports it
+        texts.update(zip(pending, completions))
+
+    trees = {}
+    for project_id, key in keys.items():
+        text = texts[key]
+        if isinstance(text, openai.OpenAIError):
+            results[project_id] = {"error": f"OpenAI API error: {str(text)}"}
+            continue
+        if isinstance(text, Exception):
+            results[project_id] = {"error": f"Unexpected error: {str(text)}"}
+            continue
+        tree = parse_task_breakdown(text)
+        if not tree:
+            results[project_id] = {"error": "AI response did not contain any tasks"}
+            continue
+        if key not in cached_keys:
+            completion_cache.put(key, text)
+            cached_keys.add(key)
+        trees[project_id] = tree
+        results[project_id] = {"message": GENERATED_MESSAGE, "tasks": len(tree)}
+
+    if trees:
+        try:
+            subtask_list = store_generated_trees(trees)
+        except Exception as e:
+            db.session.rollback()
+            for project_id in trees:
+                results[project_id] = {"error": f"Unexpected error: {str(e)}"}
+            return results
+
+        #  One assignment pass for the whole batch
+        assignment_scheduler.notify_subtasks_created(subtask.id for subtask in subtask_list)
+
+    return results
@@ -0,0 +1,135 @@
+"""Batched ``assign_tasks`` pass vs the original per-employee loop.
+
+    python bench/assignment_pass.py                          # 200 employees × 1000 subtasks × 5 milestones
+    python bench/assignment_pass.py --employees 50 --subtasks 200
+
+Both passes run against the same freshly seeded SQLite database (or
+``DATABASE_URL``, which is dropped and recreated). The per-employee loop is the
+pre-batching implementation, kept here verbatim minus its prints. Reports wall
+time, SQL statements executed and subtasks assigned.
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}")
+os.environ["START_BACKGROUND_SERVICES"] = "0"
+os.environ.setdefault("OPENAI_API_KEY", "sk-bench")
+
+from sqlalchemy import event  # noqa: E402
+from app import create_app  # noqa: E402
+from database.db import db  # noqa: E402
+
+SKILLS = ("python, api", "frontend, react", "database, sql", "testing, api", "devops, deploy")
+WORDS = ("api", "react", "database", "testing", "deploy", "python", "sql", "frontend")
+
+
+def seed(employees, subtasks, milestones):
+    from models.employee import Employee
+    from models.project import Project
+    from models.task import Milestone, Subtask, Task
+    from ai.skill_index import rebuild_index
+
+    db.drop_all()
+    db.create_all()
+    db.session.add_all(
+        Employee(employee_id=f"E{i}", name=f"Employee {i}", skills=SKILLS[i % len(SKILLS)]) for i in range(employees)
+    )
+    db.session.add(Project(project_id="P1", description="Benchmark project"))
+    for t in range(0, subtasks, 10):
+        task = Task(name=f"Task {t}", project_id="P1", status=0, total_subtasks=10, completed_subtasks=0)
+        db.session.add(task)
+        db.session.flush()
+        for s in range(t, min(t + 10, subtasks)):
+            subtask = Subtask(name=f"Build {WORDS[s % len(WORDS)]} part {s}", task_id=task.id, status=0,
+                              total_milestones=milestones, completed_milestones=0)
+            db.session.add(subtask)
+            db.session.flush()
+            db.session.add_all(Milestone(milestone_name=f"Milestone {m}", subtask_id=subtask.id, status=0) for m in range(milestones))
+    rebuild_index()
+    db.session.commit()
+    db.session.expunge_all()
+
+
+def per_employee_pass():
+    """``assign_tasks`` before batching: one scan and several commits per employee."""
+    from models.assignment import Assignment
+    from models.employee import Employee
+    from models.task import Milestone, Subtask, Task
+
+    assigned = 0
+    for employee in Employee.query.all():
+        if Assignment.query.filter_by(employee_id=employee.id, status=1).first():
+            continue
+
+        employee_skills = set(skill.strip().lower() for skill in employee.skills.split(","))
+        best_match, highest_match_score = None, 0
+        for subtask in Subtask.query.filter_by(status=0, employee_id=None).all():
+            subtask_words = set(subtask.name.lower().split())
+            match_score = sum(1 for skill in employee_skills if skill in subtask_words or any(word in skill for word in subtask_words))
+            if match_score > highest_match_score:
+                best_match, highest_match_score = subtask, match_score
+        if not best_match:
+            continue
+
+        project = db.session.get(Task, best_match.task_id)
+        best_match.employee_id = employee.id
+        best_match.status = 1
+        db.session.commit()
+        db.session.add(Assignment(employee_id=employee.id, project_id=project.project_id, subtask_id=best_match.id, status=1))
+        db.session.commit()
+        for milestone in Milestone.query.filter_by(subtask_id=best_match.id, employee_id=None).all():
+            milestone.employee_id = employee.id
+            milestone.status = 0
+            db.session.commit()
+        assigned += 1
+    return assigned
+
+
+def batched_pass():
+    from ai.task_assigner import AITaskAssignmentAgent
+
+    return AITaskAssignmentAgent(max_capacity=1).assign_tasks()["assigned"]
+
+
+def measure(run):
+    statements = []
+
+    def count(*args):
+        statements.append(1)
+
+    event.listen(db.engine, "before_cursor_execute", count)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            assigned = run()
+            elapsed = time.perf_counter() - start
+    finally:
+        event.remove(db.engine, "before_cursor_execute", count)
+    return elapsed, len(statements), assigned
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--employees", type=int, default=200)
+    parser.add_argument("--subtasks", type=int, default=1000)
+    parser.add_argument("--milestones", type=int, default=5)
+    args = parser.parse_args()
+
+    app = create_app()
+    with app.app_context():
+        print(f"{args.employees} employees × {args.subtasks} subtasks × {args.milestones} milestones on {db.engine.url.drivername}")
+        for name, run in (("per-employee loop", per_employee_pass), ("batched pass", batched_pass)):
+            seed(args.employees, args.subtasks, args.milestones)
+            elapsed, statements, assigned = measure(run)
+            print(f"  {name:17}  {elapsed:7.2f} s  {statements:6} statements  assigned {assigned}")
+            db.session.remove()
+
+
+if __name__ == "__main__":
+    main()
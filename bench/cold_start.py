@@ -0,0 +1,59 @@
+"""Cold-start time of the app: median over fresh interpreters.
+
+    python bench/cold_start.py                       # this checkout
+    git worktree add /tmp/before d2df294^            # the layout before the app factory
+    python bench/cold_start.py --repo /tmp/before --statement "import app"
+
+The "before" revision needs ``httpx`` (its ai/llm_gateway.py imports it
+directly) and ``pymysql`` (its config ignores ``DATABASE_URL``; importing
+creates the engine but does not connect).
+
+Each run starts a new interpreter, so nothing is warm except the OS page
+cache. Reports the median wall time and whether the OpenAI SDK was loaded.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = """
+import sys, time
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start, "openai" in sys.modules)
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repo", default=ROOT, help="checkout to import from")
+    parser.add_argument("--statement", default="import app; app.create_app()")
+    parser.add_argument("--runs", type=int, default=7)
+    args = parser.parse_args()
+
+    env = dict(os.environ, START_BACKGROUND_SERVICES="0", OPENAI_API_KEY=os.getenv("OPENAI_API_KEY", "sk-bench"))
+    env.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}")
+
+    timings, loaded_openai = [], set()
+    for _ in range(args.runs):
+        probe = subprocess.run(
+            [sys.executable, "-c", PROBE.format(statement=args.statement)],
+            cwd=args.repo, env=env, capture_output=True, text=True
+        )
+        if probe.returncode:
+            sys.exit(probe.stderr)
+        output = probe.stdout.split()
+        timings.append(float(output[-2]))
+        loaded_openai.add(output[-1] == "True")
+
+    print(f"{args.statement!r} in {args.repo}")
+    print(f"  median {statistics.median(timings) * 1000:.0f} ms over {args.runs} runs "
+          f"(min {min(timings) * 1000:.0f} ms), openai imported: {loaded_openai == {True}}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Task status rollup: flagged-only set-based UPDATE vs the original per-task sweep.
+
+    python bench/task_rollup.py                              # 100k tasks × 2 subtasks
+    python bench/task_rollup.py --tasks 20000 --sweep-tasks 1000
+
+Seeds a fresh SQLite database (or ``DATABASE_URL``, which is dropped and
+recreated) in which every third task has all of its subtasks finished, then
+times ``check_and_update_task_status`` with ``--flagged`` tasks flagged and with
+every task flagged. The original sweep (load every task and its subtasks,
+commit once per task) is timed over the first ``--sweep-tasks`` tasks only; it
+is far too slow to run over all of them.
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}")
+os.environ["START_BACKGROUND_SERVICES"] = "0"
+os.environ.setdefault("OPENAI_API_KEY", "sk-bench")
+
+from sqlalchemy import event, insert, update  # noqa: E402
+from app import create_app  # noqa: E402
+from database.db import db  # noqa: E402
+
+
+def seed(tasks, subtasks_per_task):
+    from models.project import Project
+    from models.task import Subtask, Task
+
+    db.drop_all()
+    db.create_all()
+    db.session.add(Project(project_id="P1", description="Benchmark project"))
+    db.session.execute(insert(Task), [
+        {"id": task_id, "name": f"Task {task_id}", "project_id": "P1", "status": 0, "needs_rollup": False,
+         "total_subtasks": subtasks_per_task, "completed_subtasks": subtasks_per_task if task_id % 3 == 0 else 0}
+        for task_id in range(1, tasks + 1)
+    ])
+    db.session.execute(insert(Subtask), [
+        {"name": f"Subtask {s} of task {task_id}", "task_id": task_id, "status": 1 if task_id % 3 == 0 else 0,
+         "total_milestones": 2, "completed_milestones": 2 if task_id % 3 == 0 else 0}
+        for task_id in range(1, tasks + 1) for s in range(subtasks_per_task)
+    ])
+    db.session.commit()
+
+
+def flag(count):
+    """Reset every task to open and flag the first ``count`` for the next rollup."""
+    from models.task import Task
+
+    db.session.execute(update(Task).values(status=0, needs_rollup=Task.id <= count))
+    db.session.commit()
+
+
+def per_task_sweep(limit):
+    """``check_and_update_task_status`` before the rollup flag, over the first ``limit`` tasks."""
+    from models.task import Subtask, Task
+
+    for task in Task.query.order_by(Task.id).limit(limit).all():
+        subtasks = Subtask.query.filter_by(task_id=task.id).all()
+        if all(subtask.status == 1 for subtask in subtasks):
+            task.status = 1
+            db.session.commit()
+
+
+def measure(run):
+    statements = []
+
+    def count(*args):
+        statements.append(1)
+
+    event.listen(db.engine, "before_cursor_execute", count)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            run()
+            elapsed = time.perf_counter() - start
+    finally:
+        event.remove(db.engine, "before_cursor_execute", count)
+    return elapsed, len(statements)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=100000)
+    parser.add_argument("--subtasks", type=int, default=2, help="subtasks per task")
+    parser.add_argument("--flagged", type=int, default=1000, help="tasks touched since the last rollup")
+    parser.add_argument("--sweep-tasks", type=int, default=5000, help="tasks the old sweep is timed over")
+    args = parser.parse_args()
+
+    from ai.task_assigner import AITaskAssignmentAgent
+    from models.task import Task
+
+    app = create_app()
+    with app.app_context():
+        seed(args.tasks, args.subtasks)
+        agent = AITaskAssignmentAgent()
+        print(f"{args.tasks} tasks × {args.subtasks} subtasks on {db.engine.url.drivername}")
+
+        for label, flagged in ((f"rollup, {args.flagged} flagged", args.flagged), (f"rollup, all {args.tasks} flagged", args.tasks)):
+            flag(flagged)
+            elapsed, statements = measure(agent.check_and_update_task_status)
+            completed = Task.query.filter_by(status=1).count()
+            print(f"  {label:32}  {elapsed:7.2f} s  {statements:6} statements  completed {completed}")
+
+        flag(0)
+        elapsed, statements = measure(lambda: per_task_sweep(args.sweep_tasks))
+        print(f"  {f'old sweep, first {args.sweep_tasks} tasks':32}  {elapsed:7.2f} s  {statements:6} statements  "
+              f"(~{elapsed * args.tasks / args.sweep_tasks:.0f} s extrapolated to every task)")
+
+
+if __name__ == "__main__":
+    main()
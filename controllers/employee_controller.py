@@ -0,0 +1,68 @@
+from collections import defaultdict
+from sqlalchemy import Integer, cast, select
+from database.db import db
+from models.employee import Employee
+from models.employee_skill import EmployeeSkill
+from models.assignment import Assignment
+from models.logs import AssignmentLog
+from controllers.pagination import date_arg
+from ai.skill_index import parse_skills
+
+
+def set_employee_skills(employee, skills, proficiency=None):
+    """Replace the normalized skill rows of an employee from a comma-separated string.
+
+    ``proficiency`` optionally maps a skill to its rating. Caller commits.
+    """
+    proficiency = {k.strip().lower(): v for k, v in (proficiency or {}).items()}
+    employee.skills = skills
+    employee.skill_entries = [
+        EmployeeSkill(skill=skill, proficiency=proficiency.get(skill))
+        for skill in sorted(parse_skills(skills))
+    ]
+
+
+def load_employee_skills(employees):
+    """Return ``{employee.id: set(skill)}`` for the given employees in one query.
+
+    Employees without rows in ``employee_skills`` (created before the table
+    existed and not yet migrated) fall back to parsing ``Employee.skills``.
+    """
+    skills_by_employee = defaultdict(set)
+    employee_ids = [employee.id for employee in employees]
+    if employee_ids:
+        rows = db.session.query(EmployeeSkill.employee_id, EmployeeSkill.skill).filter(
+            EmployeeSkill.employee_id.in_(employee_ids)
+        )
+        for employee_id, skill in rows:
+            skills_by_employee[employee_id].add(skill)
+
+    for employee in employees:
+        if employee.id not in skills_by_employee:
+            skills_by_employee[employee.id] = parse_skills(employee.skills)
+    return dict(skills_by_employee)
+
+
+def employee_query(skill=None, project_id=None):
+    """Employee query narrowed to those having ``skill`` and/or assigned to ``project_id``."""
+    query = Employee.query
+    if skill:
+        query = query.join(EmployeeSkill, EmployeeSkill.employee_id == Employee.id).filter(
+            EmployeeSkill.skill == skill.strip().lower()
+        )
+    if project_id:
+        # ✅ Assignment.employee_id holds Employee.id as a string
+        assigned = select(cast(Assignment.employee_id, Integer)).where(Assignment.project_id == project_id)
+        query = query.filter(Employee.id.in_(assigned))
+    return query
+
+
+def employee_logs_query(employee_id):
+    """Logs of an employee, narrowed by the request's ``?since=`` / ``?until=`` date range."""
+    query = AssignmentLog.query.filter_by(employee_id=employee_id)
+    since, until = date_arg("since"), date_arg("until")
+    if since:
+        query = query.filter(AssignmentLog.timestamp >= since)
+    if until:
+        query = query.filter(AssignmentLog.timestamp < until)
+    return query
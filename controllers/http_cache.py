@@ -0,0 +1,177 @@
+import threading
+import time
+from collections import OrderedDict
+from flask import Response, current_app, request
+from sqlalchemy import insert, update
+from sqlalchemy.exc import IntegrityError
+from database.db import db
+from models.resource_version import ResourceVersion
+from config import Config
+
+
+def bump_versions(keys):
+    """Increment the version of every ``(resource, resource_id)`` in ``keys``.
+
+    One UPDATE per resource type plus, for resources never versioned before,
+    one INSERT. Keys are locked in primary key order so concurrent writers
+    cannot deadlock on them. Nothing is committed: call it inside the
+    transaction that makes the change.
+    """
+    by_resource = {}
+    for resource, resource_id in keys:
+        by_resource.setdefault(resource, set()).add(str(resource_id))
+
+    for resource, resource_ids in sorted(by_resource.items()):
+        resource_ids = sorted(resource_ids)
+        bump = (
+            update(ResourceVersion)
+            .values(version=ResourceVersion.version + 1)
+            .execution_options(synchronize_session=False)
+        )
+        db.session.execute(bump.where(ResourceVersion.resource == resource, ResourceVersion.resource_id.in_(resource_ids)))
+        existing = {
+            resource_id for (resource_id,) in db.session.query(ResourceVersion.resource_id).filter(
+                ResourceVersion.resource == resource, ResourceVersion.resource_id.in_(resource_ids)
+            )
+        }
+        missing = [resource_id for resource_id in resource_ids if resource_id not in existing]
+        if not missing:
+            continue
+        try:
+            with db.session.begin_nested():
+                db.session.execute(insert(ResourceVersion), [
+                    {"resource": resource, "resource_id": resource_id, "version": 1} for resource_id in missing
+                ])
+        except IntegrityError:
+            #  A concurrent writer created some of them first: bump or create one by one
+            for resource_id in missing:
+                try:
+                    with db.session.begin_nested():
+                        db.session.execute(insert(ResourceVersion).values(resource=resource, resource_id=resource_id, version=1))
+                except IntegrityError:
+                    db.session.execute(bump.where(ResourceVersion.resource == resource, ResourceVersion.resource_id == resource_id))
+
+
+def current_version(resource, resource_id):
+    """Version stamp of a resource; 0 until its first change."""
+    return db.session.query(ResourceVersion.version).filter(
+        ResourceVersion.resource == resource, ResourceVersion.resource_id == str(resource_id)
+    ).scalar() or 0
+
+
+class LocalResponseCache:
+    """Bounded in-process LRU with per-entry expiry.
+
+    Implements the ``get`` / ``set(key, value, ex=seconds)`` / ``delete``
+    subset of the Redis client API, so a ``redis.Redis`` instance can be used
+    instead.
+    """
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # key -> (expires_at, value)
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] is not None and entry[0] < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, value, ex=None):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ex if ex else None, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, *keys):
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def __len__(self):
+        return len(self._entries)
+
+
+def make_response_cache(url, max_entries=256):
+    """``"local"`` for the in-process LRU, a ``redis://`` URL for a shared cache, or ``""`` for none."""
+    if not url:
+        return None
+    if url == "local":
+        return LocalResponseCache(max_entries)
+    import redis  # ✅ Only needed when a shared cache is configured
+
+    return redis.Redis.from_url(url)
+
+
+class HTTPCacheMetrics:
+    """Process-wide conditional GET counters."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.requests = 0
+            self.not_modified = 0
+            self.cache_hits = 0
+            self.cache_misses = 0
+
+    def record(self, outcome):
+        with self._lock:
+            self.requests += 1
+            setattr(self, outcome, getattr(self, outcome) + 1)
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "not_modified": self.not_modified,
+                "cache_hits": self.cache_hits,
+                "cache_misses": self.cache_misses,
+                "rebuilt_ratio": round(self.cache_misses / self.requests, 3) if self.requests else 0.0,
+            }
+
+
+http_cache_metrics = HTTPCacheMetrics()
+
+# ✅ Response bodies keyed on resource versions; stale keys simply age out
+response_cache = make_response_cache(Config.RESPONSE_CACHE, Config.RESPONSE_CACHE_MAX_ENTRIES)
+
+
+def conditional_json(resource, resource_id, build):
+    """JSON response for a versioned resource, with a strong ETag.
+
+    The version is read first, so a change committed while ``build`` runs can
+    only make the ETag older than the body, never newer. ``If-None-Match``
+    with the current ETag gets an empty 304; otherwise the body comes from
+    the response cache or ``build()``.
+    """
+    version = current_version(resource, resource_id)
+    etag = f"{resource}-{resource_id}-v{version}"
+
+    if request.if_none_match.contains(etag):
+        http_cache_metrics.record("not_modified")
+        response = Response(status=304)
+    else:
+        cache_key = f"response:{etag}"
+        body = response_cache.get(cache_key) if response_cache is not None else None
+        if body is None:
+            http_cache_metrics.record("cache_misses")
+            body = current_app.json.response(build()).get_data()
+            if response_cache is not None:
+                response_cache.set(cache_key, body, ex=Config.RESPONSE_CACHE_TTL)
+        else:
+            http_cache_metrics.record("cache_hits")
+        response = current_app.response_class(body, mimetype="application/json")
+
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = "no-cache"  # ✅ Clients may store it but must revalidate
+    return response
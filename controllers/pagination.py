@@ -0,0 +1,105 @@
+import base64
+import json
+from datetime import datetime
+from urllib.parse import urlencode
+from flask import current_app, jsonify, request
+from sqlalchemy import DateTime, and_, or_
+
+
+class InvalidListParams(ValueError):
+    """Raised for malformed ``limit``/``cursor``/``fields``/date arguments (400 to the client)."""
+
+
+def page_limit():
+    """``?limit=`` clamped to ``[1, PAGE_SIZE_MAX]``, ``PAGE_SIZE_DEFAULT`` when absent."""
+    default = current_app.config["PAGE_SIZE_DEFAULT"]
+    try:
+        limit = int(request.args.get("limit", default))
+    except ValueError:
+        raise InvalidListParams("limit must be an integer")
+    return max(1, min(limit, current_app.config["PAGE_SIZE_MAX"]))
+
+
+def requested_fields(allowed, default):
+    """Fields listed in ``?fields=a,b`` (validated against ``allowed``), else ``default``."""
+    raw = request.args.get("fields")
+    if not raw:
+        return list(default)
+    fields = [field.strip() for field in raw.split(",") if field.strip()]
+    unknown = [field for field in fields if field not in allowed]
+    if unknown:
+        raise InvalidListParams(f"unknown fields: {', '.join(unknown)}; allowed: {', '.join(allowed)}")
+    return fields
+
+
+def date_arg(name):
+    """Parse an ISO-8601 date/datetime query argument, or None."""
+    raw = request.args.get(name)
+    if not raw:
+        return None
+    try:
+        return datetime.fromisoformat(raw)
+    except ValueError:
+        raise InvalidListParams(f"{name} must be an ISO-8601 date or datetime")
+
+
+def encode_cursor(values):
+    return base64.urlsafe_b64encode(json.dumps(values, default=str).encode()).decode().rstrip("=")
+
+
+def decode_cursor(token, key_columns):
+    """Decode an opaque cursor back into values typed like ``key_columns``."""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+        if len(values) != len(key_columns):
+            raise ValueError
+        return [
+            datetime.fromisoformat(value) if isinstance(column.type, DateTime) else value
+            for column, value in zip(key_columns, values)
+        ]
+    except (ValueError, TypeError):
+        raise InvalidListParams("invalid cursor")
+
+
+def keyset_page(query, key_columns, limit, descending=False):
+    """Fetch one page of ``query`` ordered by ``key_columns`` after ``?cursor=``.
+
+    The cursor condition is expanded to ``a >= x AND ((a > x) OR (a = x AND
+    b > y))`` so it stays an index range scan on every backend, and no
+    OFFSET is ever used. Returns ``(rows, next_cursor)``; ``next_cursor`` is None on the last page.
+    """
+    cursor = request.args.get("cursor")
+    if cursor:
+        values = decode_cursor(cursor, key_columns)
+        clauses = []
+        for i, column in enumerate(key_columns):
+            beyond = column < values[i] if descending else column > values[i]
+            clauses.append(and_(*[key_columns[j] == values[j] for j in range(i)], beyond))
+        leading = key_columns[0] <= values[0] if descending else key_columns[0] >= values[0]
+        query = query.filter(leading, or_(*clauses))
+
+    order = [column.desc() if descending else column.asc() for column in key_columns]
+    rows = query.order_by(*order).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor([getattr(last, column.key) for column in key_columns])
+    return rows, next_cursor
+
+
+def project_row(row, fields, serializers):
+    """Serialize only the requested ``fields`` of a row."""
+    return {field: serializers[field](row) for field in fields}
+
+
+def list_response(items, next_cursor):
+    """JSON array response; the next page is advertised in ``X-Next-Cursor`` and ``Link``."""
+    response = jsonify(items)
+    if next_cursor:
+        args = request.args.to_dict()
+        args["cursor"] = next_cursor
+        response.headers["X-Next-Cursor"] = next_cursor
+        response.headers["Link"] = f'<{request.path}?{urlencode(args)}>; rel="next"'
+    return response
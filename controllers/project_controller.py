@@ -0,0 +1,166 @@
+from datetime import datetime
+from sqlalchemy import case, update
+from sqlalchemy.orm import selectinload
+from database.db import db
+from models.task import Task, Subtask, Milestone
+from models.assignment import Assignment
+from ai.skill_index import unindex_subtasks
+from controllers.workload_controller import record_milestone_completed
+from controllers.reference_cache import employee_cache
+from ai.change_feed import change, record_changes
+
+
+def load_project_tree(project_id):
+    """Build the Task → Subtask → Milestone → Employee tree of a project.
+
+    Uses a fixed number of queries no matter how many tasks, subtasks or
+    milestones the project has: tasks, subtasks, milestones, subtask
+    assignments and project assignments. Referenced employees come from the
+    employee cache, with any misses fetched together.
+    """
+    tasks = (
+        Task.query.filter_by(project_id=project_id)
+        .options(
+            selectinload(Task.subtasks).selectinload(Subtask.milestones),
+            selectinload(Task.subtasks).selectinload(Subtask.assignments),
+        )
+        .order_by(Task.id)
+        .all()
+    )
+    project_assignments = Assignment.query.filter_by(project_id=project_id).all()
+
+    #  Collect every referenced employee so they can be looked up together
+    employee_ids = {str(a.employee_id) for a in project_assignments}
+    for task in tasks:
+        for subtask in task.subtasks:
+            employee_ids.update(str(a.employee_id) for a in subtask.assignments)
+
+    #  Assignment.employee_id holds Employee.id as a string
+    cached = employee_cache.get_many(sorted(int(emp_id) for emp_id in employee_ids if emp_id.isdigit()))
+    employees_by_id = {str(emp_id): emp for emp_id, emp in cached.items()}
+
+    employees = []
+    seen = set()
+    for a in project_assignments:
+        emp = employees_by_id.get(str(a.employee_id))
+        if emp and emp.id not in seen:
+            seen.add(emp.id)
+            employees.append({"id": emp.id, "name": emp.name, "skills": emp.skills.split(",")})
+
+    task_list = []
+    for task in tasks:
+        task_data = {"id": task.id, "name": task.name, "subtasks": []}
+
+        for subtask in sorted(task.subtasks, key=lambda s: s.id):
+            assigned = min(subtask.assignments, key=lambda a: a.id) if subtask.assignments else None
+            assigned_employee = employees_by_id.get(str(assigned.employee_id)) if assigned else None
+            employee_info = {
+                "id": assigned.employee_id,
+                "name": assigned_employee.name
+            } if assigned_employee else None
+
+            milestones = [
+                {"id": m.id, "name": m.milestone_name, "status": m.status}
+                for m in sorted(subtask.milestones, key=lambda m: m.id)
+            ]
+
+            task_data["subtasks"].append({
+                "id": subtask.id,
+                "name": subtask.name,
+                "employee": employee_info,
+                "milestones": milestones
+            })
+
+        task_list.append(task_data)
+
+    return {"employees": employees, "tasks": task_list}
+
+
+def complete_milestone(milestone_id):
+    """Mark a milestone completed and roll the completion up to its subtask and task.
+
+    The milestone update, the subtask/task counter increments and the change
+    events pushed to dashboards run in one transaction with a fixed number of
+    statements. Returns None when the milestone does not exist, otherwise a
+    dict describing what changed; a milestone that was already completed
+    gets ``already_completed`` and its stored ``completed_at``.
+    """
+    row = (
+        db.session.query(Milestone.subtask_id, Milestone.employee_id, Subtask.task_id, Task.project_id)
+        .join(Subtask, Milestone.subtask_id == Subtask.id)
+        .join(Task, Subtask.task_id == Task.id)
+        .filter(Milestone.id == milestone_id)
+        .first()
+    )
+    if row is None:
+        return None
+
+    subtask_id, employee_id, task_id, project_id = row
+    result = {
+        "milestone_id": milestone_id,
+        "subtask_id": subtask_id,
+        "task_id": task_id,
+        "employee_id": employee_id,
+        "completed_at": datetime.utcnow(),
+        "subtask_completed": False,
+        "task_completed": False,
+    }
+
+    #  Conditional update so a milestone is only ever counted once
+    updated = db.session.execute(
+        update(Milestone)
+        .where(Milestone.id == milestone_id, Milestone.status != 1)
+        .values(status=1, completed_at=result["completed_at"])
+    ).rowcount
+    if not updated:
+        #  Already completed: report when that happened instead of now
+        result["completed_at"] = db.session.query(Milestone.completed_at).filter(Milestone.id == milestone_id).scalar()
+        db.session.rollback()
+        result["already_completed"] = True
+        return result
+
+    #  Keep the employee dashboard read model in step
+    record_milestone_completed(milestone_id, result["completed_at"])
+
+    #  status is listed first so MySQL (which applies SET left to right) and
+    #  SQLite/PostgreSQL (which use the old row) both see the pre-increment count
+    db.session.execute(
+        update(Subtask)
+        .where(Subtask.id == subtask_id)
+        .ordered_values(
+            (Subtask.status, case((Subtask.completed_milestones + 1 >= Subtask.total_milestones, 1), else_=Subtask.status)),
+            (Subtask.completed_milestones, Subtask.completed_milestones + 1),
+        )
+    )
+    completed, total = db.session.query(Subtask.completed_milestones, Subtask.total_milestones).filter(
+        Subtask.id == subtask_id
+    ).one()
+
+    if completed == total:
+        result["subtask_completed"] = True
+        unindex_subtasks([subtask_id])
+        db.session.execute(
+            update(Task)
+            .where(Task.id == task_id)
+            .ordered_values(
+                (Task.status, case((Task.completed_subtasks + 1 >= Task.total_subtasks, 1), else_=Task.status)),
+                (Task.completed_subtasks, Task.completed_subtasks + 1),
+                (Task.needs_rollup, True),
+            )
+        )
+        completed, total = db.session.query(Task.completed_subtasks, Task.total_subtasks).filter(
+            Task.id == task_id
+        ).one()
+        result["task_completed"] = completed == total
+
+    #  Granular deltas for connected dashboards, committed with the change itself
+    data = {k: result[k] for k in ("milestone_id", "subtask_id", "task_id", "employee_id", "completed_at")}
+    changes = [change("milestone_completed", data, project_id, employee_id)]
+    if result["subtask_completed"]:
+        changes.append(change("subtask_completed", data, project_id, employee_id))
+    if result["task_completed"]:
+        changes.append(change("task_completed", data, project_id, employee_id))
+    record_changes(changes)
+
+    db.session.commit()
+    return result
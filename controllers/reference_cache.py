@@ -0,0 +1,99 @@
+import threading
+from collections import namedtuple
+from database.db import db
+from models.employee import Employee
+from models.project import Project
+from controllers.http_cache import LocalResponseCache
+from controllers.employee_controller import load_employee_skills
+from ai.skill_index import tokenize
+from config import Config
+
+#  Immutable snapshots, safe to share across requests and threads (never ORM instances)
+EmployeeInfo = namedtuple("EmployeeInfo", "id employee_id name skills skill_set skill_tokens")
+ProjectInfo = namedtuple("ProjectInfo", "project_id description")
+
+
+class ReferenceCache:
+    """Read-through LRU/TTL cache of rarely-changing rows, keyed by primary key.
+
+    ``loader(keys)`` returns ``{key: snapshot}`` for the keys it found; misses
+    of a ``get_many`` are loaded with a single call. Keys that do not exist
+    are not cached, so rows added by another process show up immediately;
+    changes to existing rows are picked up on ``invalidate`` in this process
+    and after ``ttl`` seconds elsewhere.
+    """
+
+    def __init__(self, name, loader, max_entries=10000, ttl=300):
+        self.name = name
+        self.loader = loader
+        self.ttl = ttl
+        self._store = LocalResponseCache(max_entries)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys):
+        found, missing = {}, []
+        for key in dict.fromkeys(keys):
+            value = self._store.get(key)
+            if value is None:
+                missing.append(key)
+            else:
+                found[key] = value
+        with self._lock:
+            self.hits += len(found)
+            self.misses += len(missing)
+
+        if missing:
+            for key, value in self.loader(missing).items():
+                self._store.set(key, value, ex=self.ttl)
+                found[key] = value
+        return found
+
+    def invalidate(self, *keys):
+        """Drop cached rows after they were added or changed. Call it after the commit."""
+        self._store.delete(*keys)
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+                "size": len(self._store),
+            }
+
+
+def load_employee_infos(employee_ids):
+    """Employees with their normalized skills and skill tokens: two queries for any number of ids."""
+    employees = Employee.query.filter(Employee.id.in_(employee_ids)).all()
+    skills_by_employee = load_employee_skills(employees)
+    infos = {}
+    for employee in employees:
+        skill_set = frozenset(skills_by_employee[employee.id])
+        infos[employee.id] = EmployeeInfo(
+            employee.id, employee.employee_id, employee.name, employee.skills, skill_set,
+            tuple(tokens for tokens in (tokenize(skill) for skill in sorted(skill_set)) if tokens)
+        )
+    return infos
+
+
+def load_project_infos(project_ids):
+    """Project descriptions in one query."""
+    rows = db.session.query(Project.project_id, Project.description).filter(Project.project_id.in_(project_ids))
+    return {project_id: ProjectInfo(project_id, description) for project_id, description in rows}
+
+
+# ✅ Shared caches; the add-employee / add-project routes invalidate them
+employee_cache = ReferenceCache(
+    "employees", load_employee_infos,
+    max_entries=Config.REFERENCE_CACHE_MAX_ENTRIES, ttl=Config.REFERENCE_CACHE_TTL
+)
+project_cache = ReferenceCache(
+    "projects", load_project_infos,
+    max_entries=Config.REFERENCE_CACHE_MAX_ENTRIES, ttl=Config.REFERENCE_CACHE_TTL
+)
@@ -0,0 +1,108 @@
+from sqlalchemy import insert, update
+from database.db import db
+from models.task import Task, Milestone
+from models.employee_workload import EmployeeWorkload
+from controllers.reference_cache import project_cache
+
+
+def record_assignments(assignments):
+    """Add workload rows for freshly assigned subtasks.
+
+    ``assignments`` is a list of ``(employee_id, subtask, project_id)``. Task
+    names and milestones are fetched in one query each and the rows go out as
+    a single executemany. Nothing is committed: call it inside the transaction
+    that creates the assignments.
+    """
+    if not assignments:
+        return
+    subtask_ids = [subtask.id for _, subtask, _ in assignments]
+    task_names = dict(
+        db.session.query(Task.id, Task.name).filter(Task.id.in_({subtask.task_id for _, subtask, _ in assignments}))
+    )
+    milestones_by_subtask = {}
+    for milestone_id, subtask_id, name, status, completed_at in (
+        db.session.query(Milestone.id, Milestone.subtask_id, Milestone.milestone_name, Milestone.status, Milestone.completed_at)
+        .filter(Milestone.subtask_id.in_(subtask_ids))
+        .order_by(Milestone.id)
+    ):
+        milestones_by_subtask.setdefault(subtask_id, []).append((milestone_id, name, status or 0, completed_at))
+
+    rows = []
+    for employee_id, subtask, project_id in assignments:
+        base = {
+            "employee_id": employee_id, "project_id": project_id,
+            "task_id": subtask.task_id, "task_name": task_names.get(subtask.task_id),
+            "subtask_id": subtask.id, "subtask_name": subtask.name,
+        }
+        milestones = milestones_by_subtask.get(subtask.id) or [(None, None, 0, None)]
+        rows.extend(
+            dict(base, milestone_id=milestone_id, milestone_name=name, milestone_status=status, completed_at=completed_at)
+            for milestone_id, name, status, completed_at in milestones
+        )
+    db.session.execute(insert(EmployeeWorkload), rows)
+
+
+def record_milestone_completed(milestone_id, completed_at):
+    """Reflect a completed milestone in the workload rows. Caller commits."""
+    db.session.execute(
+        update(EmployeeWorkload)
+        .where(EmployeeWorkload.milestone_id == milestone_id)
+        .values(milestone_status=1, completed_at=completed_at)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def load_employee_tasks(employee_id):
+    """Tasks → subtasks → milestones assigned to an employee, from one indexed query.
+
+    Each subtask also reports its milestone progress and whether it is
+    completed.
+    """
+    rows = (
+        db.session.query(
+            EmployeeWorkload.task_id, EmployeeWorkload.task_name,
+            EmployeeWorkload.subtask_id, EmployeeWorkload.subtask_name,
+            EmployeeWorkload.milestone_id, EmployeeWorkload.milestone_name, EmployeeWorkload.milestone_status
+        )
+        .filter(EmployeeWorkload.employee_id == employee_id, EmployeeWorkload.subtask_id.isnot(None))
+        .order_by(EmployeeWorkload.task_id, EmployeeWorkload.subtask_id, EmployeeWorkload.milestone_id)
+        .all()
+    )
+
+    task_data = {}
+    subtask_data = {}
+    for task_id, task_name, subtask_id, subtask_name, milestone_id, milestone_name, milestone_status in rows:
+        if task_id not in task_data:
+            task_data[task_id] = {"id": task_id, "task_name": task_name, "subtasks": []}
+        subtask = subtask_data.get(subtask_id)
+        if subtask is None:
+            subtask = subtask_data[subtask_id] = {
+                "subtask_id": subtask_id,
+                "subtask_name": subtask_name,
+                "milestones": [],
+                "total_milestones": 0,
+                "completed_milestones": 0,
+            }
+            task_data[task_id]["subtasks"].append(subtask)
+        #  A subtask assigned twice yields each milestone twice, on adjacent rows
+        if milestone_id is not None and not any(m["milestone_id"] == milestone_id for m in subtask["milestones"][-1:]):
+            subtask["milestones"].append({"milestone_id": milestone_id, "name": milestone_name, "status": milestone_status})
+            subtask["total_milestones"] += 1
+            subtask["completed_milestones"] += milestone_status == 1
+
+    for subtask in subtask_data.values():
+        subtask["completed"] = subtask["total_milestones"] > 0 and subtask["completed_milestones"] == subtask["total_milestones"]
+    return list(task_data.values())
+
+
+def load_employee_projects(employee_id):
+    """Distinct projects an employee has work in: one indexed query, descriptions from the project cache."""
+    project_ids = sorted(
+        project_id for (project_id,) in
+        db.session.query(EmployeeWorkload.project_id).filter(EmployeeWorkload.employee_id == employee_id).distinct()
+    )
+    projects = project_cache.get_many(project_ids)
+    return [
+        {"project_id": project_id, "description": projects[project_id].description}
+        for project_id in project_ids if project_id in projects
+    ]
@@ -0,0 +1,112 @@
+import threading
+import time
+from sqlalchemy import event, exc
+from sqlalchemy.pool import QueuePool
+
+
+class PoolMetrics:
+    """Process-wide connection pool counters (checkouts, waits, timeouts)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.checkouts = 0
+            self.checked_out = 0
+            self.peak_checked_out = 0
+            self.timeouts = 0
+            self.total_wait = 0.0
+            self.max_wait = 0.0
+
+    def record_wait(self, seconds, timed_out=False):
+        with self._lock:
+            self.total_wait += seconds
+            self.max_wait = max(self.max_wait, seconds)
+            if timed_out:
+                self.timeouts += 1
+
+    def record_checkout(self):
+        with self._lock:
+            self.checkouts += 1
+            self.checked_out += 1
+            self.peak_checked_out = max(self.peak_checked_out, self.checked_out)
+
+    def record_checkin(self):
+        with self._lock:
+            self.checked_out -= 1
+
+    def snapshot(self, pool=None):
+        with self._lock:
+            data = {
+                "checkouts": self.checkouts,
+                "checked_out": self.checked_out,
+                "peak_checked_out": self.peak_checked_out,
+                "timeouts": self.timeouts,
+                "total_wait_ms": round(self.total_wait * 1000, 2),
+                "avg_wait_ms": round(self.total_wait * 1000 / self.checkouts, 3) if self.checkouts else 0.0,
+                "max_wait_ms": round(self.max_wait * 1000, 2),
+            }
+        if isinstance(pool, QueuePool):
+            data.update(pool_size=pool.size(), overflow=pool.overflow(), idle=pool.checkedin())
+        return data
+
+
+pool_metrics = PoolMetrics()
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that records how long callers wait for a connection."""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            pool_metrics.record_wait(time.perf_counter() - start, timed_out=True)
+            raise
+        pool_metrics.record_wait(time.perf_counter() - start)
+        return connection
+
+
+def engine_options(database_uri, pool_size, max_overflow, pool_recycle, pool_timeout, pre_ping):
+    """SQLAlchemy engine options for ``database_uri``.
+
+    In-memory SQLite keeps its single-connection pool; every other database
+    gets an instrumented, sized QueuePool.
+    """
+    options = {"pool_pre_ping": pre_ping}
+    if database_uri.startswith("sqlite") and (database_uri in ("sqlite://", "sqlite:///") or ":memory:" in database_uri):
+        return options
+    options.update(
+        poolclass=InstrumentedQueuePool,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_recycle=pool_recycle,
+        pool_timeout=pool_timeout,
+    )
+    return options
+
+
+def configure_engine(engine, statement_timeout_ms=0):
+    """Attach pool metrics and the per-session statement timeout to an engine."""
+    event.listen(engine, "checkout", lambda *args: pool_metrics.record_checkout())
+    event.listen(engine, "checkin", lambda *args: pool_metrics.record_checkin())
+
+    if not statement_timeout_ms:
+        return
+
+    dialect = engine.dialect.name
+    if dialect == "mysql":
+        statement = f"SET SESSION max_execution_time = {int(statement_timeout_ms)}"  # ✅ Applies to SELECTs
+    elif dialect == "postgresql":
+        statement = f"SET statement_timeout = {int(statement_timeout_ms)}"
+    else:
+        return  # SQLite has no server-side statement timeout
+
+    @event.listens_for(engine, "connect")
+    def set_statement_timeout(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute(statement)
+        cursor.close()
@@ -0,0 +1,54 @@
+"""backfill subtask_tokens from open subtasks
+
+Revision ID: 3e6c9b15d7a0
+Revises: d7b1f4a83e26
+Create Date: 2026-10-18 19:02:47.518203
+
+"""
+import re
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3e6c9b15d7a0'
+down_revision = 'd7b1f4a83e26'
+branch_labels = None
+depends_on = None
+
+# Frozen copy of ai.skill_index.tokenize as of this revision: migrations must
+# not change behaviour when the application code does. If the runtime
+# tokenizer changes later, re-run ``flask rebuild-skill-index``.
+STOPWORDS = {"a", "an", "and", "as", "for", "from", "in", "into", "of", "on", "or", "the", "to", "with"}
+TOKEN_PATTERN = re.compile(r"[a-z0-9+#]+")
+
+
+def tokenize(text):
+    return {
+        token[:100] for token in TOKEN_PATTERN.findall((text or "").lower())
+        if token not in STOPWORDS
+    }
+
+
+subtask_tokens = sa.table('subtask_tokens',
+    sa.column('token', sa.String(length=100)),
+    sa.column('subtask_id', sa.Integer()),
+)
+
+
+def upgrade():
+    # Rebuild the postings of every open subtask (8f3b2d61c0a4 created the table empty)
+    bind = op.get_bind()
+    op.execute(subtask_tokens.delete())
+    rows = []
+    for subtask_id, name in bind.execute(sa.text(
+        "SELECT id, name FROM subtasks WHERE status = 0 AND employee_id IS NULL"
+    )):
+        rows.extend({"token": token, "subtask_id": subtask_id} for token in sorted(tokenize(name)))
+    if rows:
+        op.bulk_insert(subtask_tokens, rows)
+
+
+def downgrade():
+    # Postings are derived data: leave them for the runtime index to maintain
+    pass
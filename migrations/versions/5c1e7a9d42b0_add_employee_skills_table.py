@@ -0,0 +1,41 @@
+"""add employee_skills table
+
+Revision ID: 5c1e7a9d42b0
+Revises: 2b5fd3538811
+Create Date: 2026-10-18 10:12:31.402117
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5c1e7a9d42b0'
+down_revision = '2b5fd3538811'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    employee_skills = op.create_table('employee_skills',
+    sa.Column('employee_id', sa.Integer(), nullable=False),
+    sa.Column('skill', sa.String(length=100), nullable=False),
+    sa.Column('proficiency', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['employee_id'], ['employees.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('employee_id', 'skill')
+    )
+    op.create_index('ix_employee_skills_skill', 'employee_skills', ['skill', 'employee_id'], unique=False)
+
+    # Backfill from the comma-separated employees.skills column
+    bind = op.get_bind()
+    rows = []
+    for employee_id, skills in bind.execute(sa.text("SELECT id, skills FROM employees")):
+        normalized = {skill.strip().lower()[:100] for skill in (skills or "").split(",") if skill.strip()}
+        rows.extend({"employee_id": employee_id, "skill": skill} for skill in sorted(normalized))
+    if rows:
+        op.bulk_insert(employee_skills, rows)
+
+
+def downgrade():
+    op.drop_index('ix_employee_skills_skill', table_name='employee_skills')
+    op.drop_table('employee_skills')
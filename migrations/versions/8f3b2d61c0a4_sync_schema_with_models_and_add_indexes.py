@@ -0,0 +1,163 @@
+"""sync schema with models and add hot-path indexes
+
+Revision ID: 8f3b2d61c0a4
+Revises: 5c1e7a9d42b0
+Create Date: 2026-10-18 11:03:54.218390
+
+The initial revision only knew about an early layout of employees, projects
+and assignments, while most databases were created by ``db.create_all()``.
+This revision converges both kinds of database on the current models:
+legacy projects/assignments tables are rebuilt, missing tables are created
+and the indexes backing the hot filters are added when absent.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8f3b2d61c0a4'
+down_revision = '5c1e7a9d42b0'
+branch_labels = None
+depends_on = None
+
+
+INDEXES = [
+    ('ix_tasks_project_id', 'tasks', ['project_id']),
+    ('ix_subtasks_task_id', 'subtasks', ['task_id']),
+    ('ix_subtasks_status_employee_id', 'subtasks', ['status', 'employee_id']),
+    ('ix_milestones_subtask_id_employee_id', 'milestones', ['subtask_id', 'employee_id']),
+    ('ix_assignments_employee_id_status', 'assignments', ['employee_id', 'status']),
+    ('ix_assignments_project_id', 'assignments', ['project_id']),
+    ('ix_assignments_subtask_id', 'assignments', ['subtask_id']),
+    ('ix_assignment_log_employee_id_timestamp', 'assignment_log', ['employee_id', 'timestamp']),
+    ('ix_subtask_tokens_subtask_id', 'subtask_tokens', ['subtask_id']),
+]
+
+
+def _columns(inspector, table):
+    return {column['name'] for column in inspector.get_columns(table)}
+
+
+def _create_projects():
+    op.create_table('projects',
+    sa.Column('project_id', sa.String(length=50), nullable=False),
+    sa.Column('description', sa.Text(), nullable=False),
+    sa.PrimaryKeyConstraint('project_id')
+    )
+
+
+def _create_assignments():
+    op.create_table('assignments',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('employee_id', sa.String(length=50), nullable=False),
+    sa.Column('project_id', sa.String(length=50), nullable=False),
+    sa.Column('subtask_id', sa.Integer(), nullable=True),
+    sa.Column('status', sa.Integer(), nullable=True),
+    sa.ForeignKeyConstraint(['employee_id'], ['employees.employee_id'], ),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.project_id'], ),
+    sa.ForeignKeyConstraint(['subtask_id'], ['subtasks.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+
+def upgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+    tables = set(inspector.get_table_names())
+
+    # Legacy layout: assignments keyed by integer ids, projects with a surrogate id
+    legacy_assignments = []
+    if 'assignments' in tables and 'subtask_id' not in _columns(inspector, 'assignments'):
+        legacy_assignments = bind.execute(sa.text(
+            "SELECT a.employee_id, p.project_id FROM assignments a JOIN projects p ON p.id = a.project_id"
+        )).all()
+        op.drop_table('assignments')
+        tables.discard('assignments')
+
+    legacy_projects = []
+    if 'projects' in tables and 'id' in _columns(inspector, 'projects'):
+        legacy_projects = bind.execute(sa.text("SELECT project_id, description FROM projects")).all()
+        op.drop_table('projects')
+        tables.discard('projects')
+
+    if 'projects' not in tables:
+        _create_projects()
+        if legacy_projects:
+            op.bulk_insert(sa.table('projects', sa.column('project_id'), sa.column('description')),
+                           [{"project_id": p, "description": d} for p, d in legacy_projects])
+
+    if 'tasks' not in tables:
+        op.create_table('tasks',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('name', sa.String(length=255), nullable=False),
+        sa.Column('project_id', sa.String(length=50), nullable=False),
+        sa.Column('status', sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(['project_id'], ['projects.project_id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+
+    if 'subtasks' not in tables:
+        op.create_table('subtasks',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('name', sa.String(length=255), nullable=False),
+        sa.Column('task_id', sa.Integer(), nullable=False),
+        sa.Column('employee_id', sa.String(length=50), nullable=True),
+        sa.Column('status', sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(['employee_id'], ['employees.employee_id'], ),
+        sa.ForeignKeyConstraint(['task_id'], ['tasks.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+
+    if 'milestones' not in tables:
+        op.create_table('milestones',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('subtask_id', sa.Integer(), nullable=False),
+        sa.Column('milestone_name', sa.String(length=255), nullable=False),
+        sa.Column('employee_id', sa.Integer(), nullable=True),
+        sa.Column('status', sa.Integer(), nullable=True),
+        sa.Column('completed_at', sa.TIMESTAMP(), nullable=True),
+        sa.ForeignKeyConstraint(['employee_id'], ['employees.id'], ),
+        sa.ForeignKeyConstraint(['subtask_id'], ['subtasks.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+
+    if 'assignments' not in tables:
+        _create_assignments()
+        if legacy_assignments:
+            op.bulk_insert(
+                sa.table('assignments', sa.column('employee_id'), sa.column('project_id'), sa.column('status')),
+                [{"employee_id": str(e), "project_id": p, "status": 0} for e, p in legacy_assignments]
+            )
+
+    if 'assignment_log' not in tables:
+        op.create_table('assignment_log',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('timestamp', sa.DateTime(), nullable=True),
+        sa.Column('employee_id', sa.String(length=100), nullable=True),
+        sa.Column('log_message', sa.Text(), nullable=False),
+        sa.ForeignKeyConstraint(['employee_id'], ['employees.employee_id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+
+    if 'subtask_tokens' not in tables:
+        op.create_table('subtask_tokens',
+        sa.Column('token', sa.String(length=100), nullable=False),
+        sa.Column('subtask_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['subtask_id'], ['subtasks.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('token', 'subtask_id')
+        )
+
+    inspector = sa.inspect(bind)
+    for name, table, columns in INDEXES:
+        existing = {index['name'] for index in inspector.get_indexes(table)}
+        if name not in existing:
+            op.create_index(name, table, columns, unique=False)
+
+
+def downgrade():
+    # Only the indexes are reverted; the converged tables are kept.
+    inspector = sa.inspect(op.get_bind())
+    for name, table, _columns in reversed(INDEXES):
+        if name in {index['name'] for index in inspector.get_indexes(table)}:
+            op.drop_index(name, table_name=table)
@@ -0,0 +1,52 @@
+"""align employees.employee_id and employees.skills with the model
+
+Revision ID: 9c4e1b7a2f60
+Revises: 3e6c9b15d7a0
+Create Date: 2026-10-18 19:41:12.604381
+
+The initial revision created ``employee_id`` as VARCHAR(100) and ``skills``
+as nullable, while the model (and ``db.create_all()``) uses VARCHAR(50) and
+NOT NULL. Databases built either way end up identical after this revision.
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9c4e1b7a2f60'
+down_revision = '3e6c9b15d7a0'
+branch_labels = None
+depends_on = None
+
+
+def _alter_employees(employee_id_length, new_employee_id_length, skills_nullable):
+    bind = op.get_bind()
+    mysql = bind.dialect.name == 'mysql'
+    if mysql:
+        # employee_id is referenced by subtasks, assignments and assignment_log
+        op.execute("SET FOREIGN_KEY_CHECKS = 0")
+    with op.batch_alter_table('employees') as batch_op:
+        batch_op.alter_column('employee_id', existing_type=sa.String(length=employee_id_length),
+                              type_=sa.String(length=new_employee_id_length), existing_nullable=False)
+        batch_op.alter_column('skills', existing_type=sa.Text(), nullable=skills_nullable)
+    if mysql:
+        op.execute("SET FOREIGN_KEY_CHECKS = 1")
+
+
+def upgrade():
+    bind = op.get_bind()
+    columns = {column['name']: column for column in sa.inspect(bind).get_columns('employees')}
+    if getattr(columns['employee_id']['type'], 'length', None) == 50 and not columns['skills']['nullable']:
+        return  # ✅ Created by db.create_all(), already matches the model
+
+    too_long = bind.execute(sa.text("SELECT employee_id FROM employees WHERE LENGTH(employee_id) > 50")).scalars().all()
+    if too_long:
+        raise RuntimeError(f"employees.employee_id values longer than 50 characters must be shortened first: {too_long}")
+
+    op.execute("UPDATE employees SET skills = '' WHERE skills IS NULL")
+    _alter_employees(100, 50, skills_nullable=False)
+
+
+def downgrade():
+    _alter_employees(50, 100, skills_nullable=True)
@@ -0,0 +1,45 @@
+"""add completion counters to tasks and subtasks
+
+Revision ID: a7e4c2b9d153
+Revises: 8f3b2d61c0a4
+Create Date: 2026-10-18 12:41:07.583920
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a7e4c2b9d153'
+down_revision = '8f3b2d61c0a4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('subtasks', sa.Column('total_milestones', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('subtasks', sa.Column('completed_milestones', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('tasks', sa.Column('total_subtasks', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('tasks', sa.Column('completed_subtasks', sa.Integer(), server_default='0', nullable=False))
+
+    # Backfill the counters from the existing rows. A subtask counts as finished
+    # when it has milestones and all of them are completed, the same definition
+    # complete_milestone and check_and_update_task_status use.
+    op.execute(
+        "UPDATE subtasks SET "
+        "total_milestones = (SELECT COUNT(*) FROM milestones m WHERE m.subtask_id = subtasks.id), "
+        "completed_milestones = (SELECT COUNT(*) FROM milestones m WHERE m.subtask_id = subtasks.id AND m.status = 1)"
+    )
+    op.execute(
+        "UPDATE tasks SET "
+        "total_subtasks = (SELECT COUNT(*) FROM subtasks s WHERE s.task_id = tasks.id), "
+        "completed_subtasks = (SELECT COUNT(*) FROM subtasks s WHERE s.task_id = tasks.id "
+        "AND s.total_milestones > 0 AND s.completed_milestones >= s.total_milestones)"
+    )
+
+
+def downgrade():
+    op.drop_column('tasks', 'completed_subtasks')
+    op.drop_column('tasks', 'total_subtasks')
+    op.drop_column('subtasks', 'completed_milestones')
+    op.drop_column('subtasks', 'total_milestones')
@@ -0,0 +1,38 @@
+"""add change_events feed
+
+Revision ID: a8c3e5f19d42
+Revises: f5a2d8c61b93
+Create Date: 2026-10-18 16:58:31.640215
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a8c3e5f19d42'
+down_revision = 'f5a2d8c61b93'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('change_events',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('kind', sa.String(length=50), nullable=False),
+    sa.Column('project_id', sa.String(length=50), nullable=True),
+    sa.Column('employee_id', sa.String(length=100), nullable=True),
+    sa.Column('payload', sa.Text(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_change_events_created_at', 'change_events', ['created_at'], unique=False)
+    op.create_index('ix_change_events_project_id_id', 'change_events', ['project_id', 'id'], unique=False)
+    op.create_index('ix_change_events_employee_id_id', 'change_events', ['employee_id', 'id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_change_events_employee_id_id', table_name='change_events')
+    op.drop_index('ix_change_events_project_id_id', table_name='change_events')
+    op.drop_index('ix_change_events_created_at', table_name='change_events')
+    op.drop_table('change_events')
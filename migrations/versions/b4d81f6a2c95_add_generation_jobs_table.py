@@ -0,0 +1,40 @@
+"""add generation_jobs table
+
+Revision ID: b4d81f6a2c95
+Revises: e91a5c3f7b28
+Create Date: 2026-10-18 14:47:36.118204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b4d81f6a2c95'
+down_revision = 'e91a5c3f7b28'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('generation_jobs',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('project_id', sa.String(length=50), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('tasks_parsed', sa.Integer(), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('result', sa.Text(), nullable=True),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('started_at', sa.DateTime(), nullable=True),
+    sa.Column('heartbeat_at', sa.DateTime(), nullable=True),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.project_id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_generation_jobs_status_id', 'generation_jobs', ['status', 'id'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_generation_jobs_status_id', table_name='generation_jobs')
+    op.drop_table('generation_jobs')
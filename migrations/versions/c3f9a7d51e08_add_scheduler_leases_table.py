@@ -0,0 +1,29 @@
+"""add scheduler_leases table
+
+Revision ID: c3f9a7d51e08
+Revises: b4d81f6a2c95
+Create Date: 2026-10-18 15:26:04.511872
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c3f9a7d51e08'
+down_revision = 'b4d81f6a2c95'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('scheduler_leases',
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('holder', sa.String(length=255), nullable=False),
+    sa.Column('expires_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+
+
+def downgrade():
+    op.drop_table('scheduler_leases')
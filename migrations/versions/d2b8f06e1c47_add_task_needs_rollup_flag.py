@@ -0,0 +1,27 @@
+"""add needs_rollup flag to tasks
+
+Revision ID: d2b8f06e1c47
+Revises: a7e4c2b9d153
+Create Date: 2026-10-18 13:26:44.107215
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd2b8f06e1c47'
+down_revision = 'a7e4c2b9d153'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Every existing task starts dirty so the first rollup evaluates it once
+    op.add_column('tasks', sa.Column('needs_rollup', sa.Boolean(), server_default=sa.true(), nullable=False))
+    op.create_index('ix_tasks_needs_rollup', 'tasks', ['needs_rollup'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_tasks_needs_rollup', table_name='tasks')
+    op.drop_column('tasks', 'needs_rollup')
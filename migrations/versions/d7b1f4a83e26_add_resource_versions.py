@@ -0,0 +1,29 @@
+"""add resource_versions stamps
+
+Revision ID: d7b1f4a83e26
+Revises: a8c3e5f19d42
+Create Date: 2026-10-18 17:34:08.215774
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd7b1f4a83e26'
+down_revision = 'a8c3e5f19d42'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('resource_versions',
+    sa.Column('resource', sa.String(length=20), nullable=False),
+    sa.Column('resource_id', sa.String(length=100), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('resource', 'resource_id')
+    )
+
+
+def downgrade():
+    op.drop_table('resource_versions')
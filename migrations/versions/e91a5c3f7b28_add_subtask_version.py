@@ -0,0 +1,24 @@
+"""add version column to subtasks
+
+Revision ID: e91a5c3f7b28
+Revises: d2b8f06e1c47
+Create Date: 2026-10-18 14:02:19.930551
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e91a5c3f7b28'
+down_revision = 'd2b8f06e1c47'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('subtasks', sa.Column('version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade():
+    op.drop_column('subtasks', 'version')
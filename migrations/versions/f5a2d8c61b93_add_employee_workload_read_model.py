@@ -0,0 +1,57 @@
+"""add employee_workload read model
+
+Revision ID: f5a2d8c61b93
+Revises: c3f9a7d51e08
+Create Date: 2026-10-18 16:12:45.307126
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f5a2d8c61b93'
+down_revision = 'c3f9a7d51e08'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('employee_workload',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('employee_id', sa.Integer(), nullable=False),
+    sa.Column('project_id', sa.String(length=50), nullable=False),
+    sa.Column('task_id', sa.Integer(), nullable=True),
+    sa.Column('task_name', sa.String(length=255), nullable=True),
+    sa.Column('subtask_id', sa.Integer(), nullable=True),
+    sa.Column('subtask_name', sa.String(length=255), nullable=True),
+    sa.Column('milestone_id', sa.Integer(), nullable=True),
+    sa.Column('milestone_name', sa.String(length=255), nullable=True),
+    sa.Column('milestone_status', sa.Integer(), nullable=False),
+    sa.Column('completed_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['employee_id'], ['employees.id'], ),
+    sa.ForeignKeyConstraint(['project_id'], ['projects.project_id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_employee_workload_employee_id_task_id', 'employee_workload',
+                    ['employee_id', 'task_id', 'subtask_id', 'milestone_id'], unique=False)
+    op.create_index('ix_employee_workload_milestone_id', 'employee_workload', ['milestone_id'], unique=False)
+
+    # Backfill from the existing assignments (assignments.employee_id holds employees.id as text)
+    op.execute(
+        "INSERT INTO employee_workload (employee_id, project_id, task_id, task_name, subtask_id, subtask_name, "
+        "milestone_id, milestone_name, milestone_status, completed_at) "
+        "SELECT a.employee_id, a.project_id, t.id, t.name, s.id, s.name, "
+        "m.id, m.milestone_name, COALESCE(m.status, 0), m.completed_at "
+        "FROM assignments a "
+        "JOIN employees e ON e.id = a.employee_id "
+        "LEFT JOIN subtasks s ON s.id = a.subtask_id "
+        "LEFT JOIN tasks t ON t.id = s.task_id "
+        "LEFT JOIN milestones m ON m.subtask_id = s.id"
+    )
+
+
+def downgrade():
+    op.drop_index('ix_employee_workload_milestone_id', table_name='employee_workload')
+    op.drop_index('ix_employee_workload_employee_id_task_id', table_name='employee_workload')
+    op.drop_table('employee_workload')
@@ -5,10 +5,13 @@ class Assignment(db.Model):
 
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     employee_id = db.Column(db.String(50), db.ForeignKey('employees.employee_id'), nullable=False)  # ✅ Fixed ForeignKey
-    project_id = db.Column(db.String(50), db.ForeignKey('projects.project_id'), nullable=False)  # ✅ Fixed ForeignKey
-    subtask_id = db.Column(db.Integer, db.ForeignKey('subtasks.id'), nullable=True)  # Can be NULL initially
+    project_id = db.Column(db.String(50), db.ForeignKey('projects.project_id'), nullable=False, index=True)  # ✅ Fixed ForeignKey
+    subtask_id = db.Column(db.Integer, db.ForeignKey('subtasks.id'), nullable=True, index=True)  # Can be NULL initially
     status = db.Column(db.Integer, default=0)  # 0 = In Progress, 1 = Completed
 
+    # ✅ Active-assignment lookups filter on (employee_id, status)
+    __table_args__ = (db.Index('ix_assignments_employee_id_status', 'employee_id', 'status'),)
+
     # ✅ Relationships
     employee = db.relationship('Employee', back_populates='assignments')
     project = db.relationship('Project', back_populates='assignments')
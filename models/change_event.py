@@ -0,0 +1,24 @@
+from database.db import db
+from datetime import datetime
+
+class ChangeEvent(db.Model):
+    """One dashboard change (milestone completed, subtask assigned, ...) in commit order.
+
+    Rows are written in the same transaction as the change they describe and
+    streamed to subscribed clients by id, so a reconnecting client can resume
+    from the last id it saw. Old rows are pruned by the safety-net sweep.
+    """
+    __tablename__ = 'change_events'
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    kind = db.Column(db.String(50), nullable=False)  # tasks_generated, milestone_completed, subtask_assigned, log_added, ...
+    project_id = db.Column(db.String(50), nullable=True)
+    employee_id = db.Column(db.String(100), nullable=True)
+    payload = db.Column(db.Text, nullable=False)  # JSON body sent to the client
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False, index=True)  # ✅ Pruning scans by age
+
+    # ✅ Resuming a stream reads one project's or employee's events by id
+    __table_args__ = (
+        db.Index('ix_change_events_project_id_id', 'project_id', 'id'),
+        db.Index('ix_change_events_employee_id_id', 'employee_id', 'id'),
+    )
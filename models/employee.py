@@ -11,3 +11,4 @@ class Employee(db.Model):
     # ✅ Relationships
     assignments = db.relationship('Assignment', back_populates='employee')
     subtasks = db.relationship('Subtask', back_populates='employee')
+    skill_entries = db.relationship('EmployeeSkill', back_populates='employee', cascade="all, delete-orphan")
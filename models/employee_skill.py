@@ -0,0 +1,14 @@
+from database.db import db
+
+class EmployeeSkill(db.Model):
+    __tablename__ = 'employee_skills'
+
+    employee_id = db.Column(db.Integer, db.ForeignKey('employees.id', ondelete='CASCADE'), primary_key=True)
+    skill = db.Column(db.String(100), primary_key=True)  # ✅ Normalized (stripped, lowercase) skill
+    proficiency = db.Column(db.Integer, nullable=True)  # Optional 1-5 rating
+
+    # ✅ "Who has skill X" lookups go through this index
+    __table_args__ = (db.Index('ix_employee_skills_skill', 'skill', 'employee_id'),)
+
+    # ✅ Relationships
+    employee = db.relationship('Employee', back_populates='skill_entries')
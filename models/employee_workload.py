@@ -0,0 +1,28 @@
+from database.db import db
+
+class EmployeeWorkload(db.Model):
+    """Read model behind the employee dashboard: one row per milestone assigned to an employee.
+
+    Project, task, subtask and milestone names are copied in so an employee's
+    tasks and projects come from a single indexed range scan. Rows are written
+    in the assignment transaction and updated when a milestone is completed.
+    Assignments without a subtask (legacy rows) only carry the project.
+    """
+    __tablename__ = 'employee_workload'
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    employee_id = db.Column(db.Integer, db.ForeignKey('employees.id'), nullable=False)
+    project_id = db.Column(db.String(50), db.ForeignKey('projects.project_id'), nullable=False)
+    task_id = db.Column(db.Integer, nullable=True)
+    task_name = db.Column(db.String(255), nullable=True)
+    subtask_id = db.Column(db.Integer, nullable=True)
+    subtask_name = db.Column(db.String(255), nullable=True)
+    milestone_id = db.Column(db.Integer, nullable=True, index=True)  # ✅ Completion updates look rows up by milestone
+    milestone_name = db.Column(db.String(255), nullable=True)
+    milestone_status = db.Column(db.Integer, nullable=False, default=0)  # 0 = Not Started, 1 = Completed
+    completed_at = db.Column(db.DateTime, nullable=True)
+
+    # ✅ Dashboard reads scan one employee's rows in task → subtask → milestone order
+    __table_args__ = (
+        db.Index('ix_employee_workload_employee_id_task_id', 'employee_id', 'task_id', 'subtask_id', 'milestone_id'),
+    )
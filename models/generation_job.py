@@ -0,0 +1,20 @@
+from database.db import db
+from datetime import datetime
+
+class GenerationJob(db.Model):
+    __tablename__ = 'generation_jobs'
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    project_id = db.Column(db.String(50), db.ForeignKey('projects.project_id'), nullable=False)
+    status = db.Column(db.String(20), nullable=False, default='queued')  # queued, running, succeeded, failed
+    tasks_parsed = db.Column(db.Integer, nullable=False, default=0)  # ✅ Progress: tasks received so far
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    result = db.Column(db.Text, nullable=True)  # JSON payload of the finished job
+    error = db.Column(db.Text, nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    started_at = db.Column(db.DateTime, nullable=True)
+    heartbeat_at = db.Column(db.DateTime, nullable=True)  # ✅ Refreshed while running; stale jobs are requeued
+    finished_at = db.Column(db.DateTime, nullable=True)
+
+    # ✅ Workers pick the oldest queued job
+    __table_args__ = (db.Index('ix_generation_jobs_status_id', 'status', 'id'),)
@@ -6,3 +6,6 @@ class AssignmentLog(db.Model):
     timestamp = db.Column(db.DateTime, default=datetime.utcnow)
     employee_id = db.Column(db.String(100), db.ForeignKey('employees.employee_id'))
     log_message = db.Column(db.Text, nullable=False)
+
+    # ✅ Logs are listed per employee in time order
+    __table_args__ = (db.Index('ix_assignment_log_employee_id_timestamp', 'employee_id', 'timestamp'),)
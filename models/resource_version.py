@@ -0,0 +1,13 @@
+from database.db import db
+
+class ResourceVersion(db.Model):
+    """Version stamp of a cached read resource (a project tree, an employee's tasks).
+
+    Bumped in the same transaction as every change the resource shows, so
+    ``(resource, resource_id, version)`` identifies one exact response body.
+    """
+    __tablename__ = 'resource_versions'
+
+    resource = db.Column(db.String(20), primary_key=True)  # "project" or "employee"
+    resource_id = db.Column(db.String(100), primary_key=True)
+    version = db.Column(db.Integer, nullable=False, default=1)
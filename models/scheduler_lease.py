@@ -0,0 +1,9 @@
+from database.db import db
+
+class SchedulerLease(db.Model):
+    """Cluster-wide lease: the process named in ``holder`` runs the background job ``name``."""
+    __tablename__ = 'scheduler_leases'
+
+    name = db.Column(db.String(100), primary_key=True)
+    holder = db.Column(db.String(255), nullable=False)  # host:pid:nonce of the current leader
+    expires_at = db.Column(db.DateTime, nullable=False)  # ✅ Leadership lapses unless renewed before this
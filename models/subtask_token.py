@@ -0,0 +1,8 @@
+from database.db import db
+
+class SubtaskToken(db.Model):
+    """Inverted index posting: a normalized skill token found in an open subtask's name."""
+    __tablename__ = 'subtask_tokens'
+
+    token = db.Column(db.String(100), primary_key=True)  # ✅ Leading PK column doubles as the token index
+    subtask_id = db.Column(db.Integer, db.ForeignKey('subtasks.id', ondelete='CASCADE'), primary_key=True, index=True)
@@ -7,8 +7,11 @@ class Task(db.Model):
 
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     name = db.Column(db.String(255), nullable=False)
-    project_id = db.Column(db.String(50), db.ForeignKey('projects.project_id'), nullable=False)  # ✅ Fixed ForeignKey
+    project_id = db.Column(db.String(50), db.ForeignKey('projects.project_id'), nullable=False, index=True)  # ✅ Fixed ForeignKey
     status = db.Column(db.Integer, default=0)  # 0 = Not Started, 1 = Completed
+    total_subtasks = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    completed_subtasks = db.Column(db.Integer, nullable=False, default=0, server_default='0')  # ✅ Maintained on milestone completion
+    needs_rollup = db.Column(db.Boolean, nullable=False, default=True, server_default=db.true(), index=True)  # ✅ Touched since the last status rollup
 
     # ✅ Relationships
     project = db.relationship('Project', back_populates='tasks')
@@ -20,9 +23,15 @@ class Subtask(db.Model):
 
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     name = db.Column(db.String(255), nullable=False)
-    task_id = db.Column(db.Integer, db.ForeignKey('tasks.id'), nullable=False)
+    task_id = db.Column(db.Integer, db.ForeignKey('tasks.id'), nullable=False, index=True)
     employee_id = db.Column(db.String(50), db.ForeignKey('employees.employee_id'), nullable=True)  # ✅ Fixed ForeignKey
     status = db.Column(db.Integer, default=0)  # 0 = Not Started, 1 = Completed
+    total_milestones = db.Column(db.Integer, nullable=False, default=0, server_default='0')
+    completed_milestones = db.Column(db.Integer, nullable=False, default=0, server_default='0')  # ✅ Maintained on milestone completion
+    version = db.Column(db.Integer, nullable=False, default=0, server_default='0')  # ✅ Bumped on every claim (optimistic locking)
+
+    # ✅ Open-subtask lookups filter on (status, employee_id)
+    __table_args__ = (db.Index('ix_subtasks_status_employee_id', 'status', 'employee_id'),)
 
     # ✅ Relationships
     task = db.relationship('Task', back_populates='subtasks')
@@ -41,6 +50,9 @@ class Milestone(db.Model):
     status = db.Column(db.Integer, default=0)  # 0 = Not Completed, 1 = Completed
     completed_at = db.Column(db.TIMESTAMP, nullable=True, default=None)  # ✅ Default NULL
 
+    # ✅ Milestones are always fetched per subtask, optionally only the unassigned ones
+    __table_args__ = (db.Index('ix_milestones_subtask_id_employee_id', 'subtask_id', 'employee_id'),)
+
     # ✅ Relationships
     subtask = db.relationship('Subtask', back_populates='milestones')
     
\ No newline at end of file
@@ -0,0 +1,54 @@
+from flask import Blueprint, request, jsonify
+from models.logs import AssignmentLog
+from controllers.project_controller import complete_milestone
+from controllers.pagination import InvalidListParams, keyset_page, page_limit
+from controllers.employee_controller import employee_logs_query
+
+assignment_bp = Blueprint('assignment_bp', __name__)
+
+@assignment_bp.route('/api/assign_tasks', methods=['POST'])
+def assign_tasks():
+    """Use AI Agent to assign tasks dynamically (``?mode=global`` for optimal matching)."""
+    from ai.task_assigner import ai_task_agent
+
+    mode = request.args.get("mode")
+    if mode is not None and mode not in ("greedy", "global"):
+        raise InvalidListParams("mode must be 'greedy' or 'global'")
+
+    result = ai_task_agent.assign_tasks(mode=mode)
+    return jsonify(result)
+
+@assignment_bp.route('/api/assignment_logs/<int:employee_id>', methods=['GET'])
+def get_assignment_logs(employee_id):
+    """Fetch logs related to task assignment for a specific employee, newest first.
+
+    Accepts ``?since=`` / ``?until=`` and pages with ``?limit=`` / ``?cursor=``;
+    the next page's cursor is returned as ``next_cursor``.
+    """
+    logs, next_cursor = keyset_page(
+        employee_logs_query(employee_id), [AssignmentLog.timestamp, AssignmentLog.id], page_limit(), descending=True
+    )
+
+    log_data = [{"timestamp": log.timestamp.strftime("%Y-%m-%d %H:%M:%S"), "message": log.log_message} for log in logs]
+
+    return jsonify({"logs": log_data, "next_cursor": next_cursor})
+
+
+@assignment_bp.route('/api/milestone_complete/<int:milestone_id>', methods=['POST'])
+def mark_milestone_complete(milestone_id):
+    """Mark a milestone as completed and trigger AI to assign the next subtask."""
+    result = complete_milestone(milestone_id)
+    if result is None:
+        return jsonify({"error": "Milestone not found"}), 404
+    if result.get("already_completed"):
+        return jsonify({"message": "Milestone was already completed.", "completed_at": result["completed_at"], "already_completed": True})
+
+    if result["subtask_completed"]:
+        from ai.assignment_scheduler import assignment_scheduler
+
+        print(f" Subtask {result['subtask_id']} completed by Employee {result['employee_id']}!")
+
+        #  AI assigns the next subtask dynamically, in the background
+        assignment_scheduler.notify_subtask_completed(result["employee_id"])
+
+    return jsonify({"message": "Milestone marked as completed!", "completed_at": result["completed_at"]})
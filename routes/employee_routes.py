@@ -1,17 +1,92 @@
 from flask import Blueprint, request, jsonify
+from sqlalchemy.orm import load_only
 from models.employee import Employee
+from models.logs import AssignmentLog
 from database.db import db
+from controllers.employee_controller import set_employee_skills, employee_query, employee_logs_query
+from controllers.workload_controller import load_employee_projects, load_employee_tasks
+from controllers.pagination import keyset_page, list_response, page_limit, project_row, requested_fields
+from controllers.http_cache import conditional_json
+from controllers.reference_cache import employee_cache
 
 employee_bp = Blueprint('employee_bp', __name__)
 
-@employee_bp.route('/add', methods=['POST'])
+EMPLOYEE_FIELDS = {
+    "id": lambda e: e.id,
+    "employee_id": lambda e: e.employee_id,
+    "name": lambda e: e.name,
+    "skills": lambda e: e.skills,
+}
+
+LOG_FIELDS = {
+    "id": lambda log: log.id,
+    "timestamp": lambda log: log.timestamp,
+    "message": lambda log: log.log_message,
+}
+LOG_COLUMNS = {"id": AssignmentLog.id, "timestamp": AssignmentLog.timestamp, "message": AssignmentLog.log_message}
+
+@employee_bp.route('/api/employees', methods=['POST'])
 def add_employee():
+    from ai.assignment_scheduler import assignment_scheduler
+
     data = request.json
     new_employee = Employee(
         employee_id=data.get('employee_id'),
-        name=data.get('name'),
-        skills=data.get('skills')
+        name=data.get('name')
     )
+    set_employee_skills(new_employee, data.get('skills'), data.get('proficiency'))
     db.session.add(new_employee)
     db.session.commit()
+    employee_cache.invalidate(new_employee.id)
+    assignment_scheduler.notify_employee_added(new_employee.id)
     return jsonify({"message": "Employee added successfully!"}), 201
+
+@employee_bp.route('/api/employees', methods=['GET'])
+def get_all_employees():
+    """Fetch employees a page at a time.
+
+    Filters: ``?skill=`` and ``?project=`` (assigned to that project).
+    ``?limit=`` / ``?cursor=`` page through by id, ``?fields=`` picks fields.
+    """
+    fields = requested_fields(EMPLOYEE_FIELDS, ["id", "name"])
+    query = employee_query(skill=request.args.get("skill"), project_id=request.args.get("project"))
+    query = query.options(load_only(*[getattr(Employee, field) for field in fields]))
+
+    employees, next_cursor = keyset_page(query, [Employee.id], page_limit())
+    return list_response([project_row(emp, fields, EMPLOYEE_FIELDS) for emp in employees], next_cursor)
+
+@employee_bp.route('/api/employees/<int:employee_id>', methods=['GET'])
+def get_employee(employee_id):
+    """Fetch one employee with their normalized skills, from the employee cache."""
+    employee = employee_cache.get(employee_id)
+    if not employee:
+        return jsonify({"error": "Employee not found"}), 404
+    return jsonify({
+        "id": employee.id,
+        "employee_id": employee.employee_id,
+        "name": employee.name,
+        "skills": sorted(employee.skill_set)
+    })
+
+@employee_bp.route('/api/logs/<int:employee_id>', methods=['GET'])
+def get_logs_for_employee(employee_id):
+    """Fetch logs related to a specific employee, oldest first, a page at a time."""
+    fields = requested_fields(LOG_FIELDS, ["timestamp", "message"])
+    query = employee_logs_query(employee_id).options(load_only(*[LOG_COLUMNS[field] for field in fields]))
+
+    logs, next_cursor = keyset_page(query, [AssignmentLog.timestamp, AssignmentLog.id], page_limit())
+    return list_response([project_row(log, fields, LOG_FIELDS) for log in logs], next_cursor)
+
+
+@employee_bp.route('/api/employees/<int:employee_id>/projects', methods=['GET'])
+def get_employee_projects(employee_id):
+    """Fetch the distinct projects assigned to an employee."""
+    return jsonify(load_employee_projects(employee_id))
+
+@employee_bp.route('/api/employees/<int:employee_id>/tasks', methods=['GET'])
+def get_employee_tasks(employee_id):
+    """Fetch tasks, subtasks, and milestones assigned to an employee.
+
+    Answers ``If-None-Match`` with 304 while the employee's work is unchanged.
+    """
+    return conditional_json("employee", employee_id, lambda: load_employee_tasks(employee_id))
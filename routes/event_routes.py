@@ -0,0 +1,51 @@
+import queue
+from flask import Blueprint, Response, request
+from config import Config
+from routes.sse import format_sse
+
+event_bp = Blueprint('event_bp', __name__)
+
+@event_bp.route('/api/events', methods=['GET'])
+def stream_events():
+    """Push dashboard changes as server-sent events.
+
+    ``?project=`` and/or ``?employee=`` narrow the stream to one project's or
+    one employee's changes: ``tasks_generated``, ``milestone_completed``,
+    ``subtask_completed``, ``task_completed``, ``subtask_assigned`` and
+    ``log_added``. A reconnecting
+    client resumes after its ``Last-Event-ID``. A ``reset`` event means events
+    were lost and the client should reload and reconnect.
+    """
+    from ai.change_feed import change_feed
+
+    after_id = request.headers.get("Last-Event-ID") or request.args.get("last_event_id")
+    subscription, backlog = change_feed.subscribe(
+        project_id=request.args.get("project"),
+        employee_id=request.args.get("employee"),
+        after_id=int(after_id) if after_id and after_id.isdigit() else None
+    )
+
+    def events():
+        try:
+            yield "retry: 3000\n\n"
+            if backlog is None:
+                yield format_sse("reset", {"reason": "resume point expired"})
+                return
+            for event in backlog:
+                yield format_sse(event["kind"], event["data"], event["id"])
+
+            while True:
+                try:
+                    event = subscription.events.get(timeout=Config.CHANGE_FEED_HEARTBEAT)
+                except queue.Empty:
+                    yield ": keep-alive\n\n"  # ✅ Keeps proxies from closing an idle stream
+                    continue
+                if subscription.overflowed:
+                    yield format_sse("reset", {"reason": "client fell behind"})
+                    return
+                yield format_sse(event["kind"], event["data"], event["id"])
+        finally:
+            change_feed.unsubscribe(subscription)
+
+    #  The generator never touches the database, so no pooled connection is held while streaming
+    return Response(events(), mimetype="text/event-stream", headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
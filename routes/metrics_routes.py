@@ -0,0 +1,22 @@
+from flask import Blueprint, jsonify
+from database.db import db
+from database.pool import pool_metrics
+from controllers.http_cache import http_cache_metrics
+from controllers.reference_cache import employee_cache, project_cache
+
+metrics_bp = Blueprint('metrics_bp', __name__)
+
+@metrics_bp.route('/api/metrics/db_pool', methods=['GET'])
+def db_pool_metrics():
+    """Connection pool checkouts, wait times and timeouts for this process."""
+    return jsonify(pool_metrics.snapshot(db.engine.pool))
+
+@metrics_bp.route('/api/metrics/http_cache', methods=['GET'])
+def http_cache_metrics_view():
+    """Conditional GETs answered with 304, from the response cache, or rebuilt."""
+    return jsonify(http_cache_metrics.snapshot())
+
+@metrics_bp.route('/api/metrics/reference_cache', methods=['GET'])
+def reference_cache_metrics():
+    """Hit rates of the employee and project caches in this process."""
+    return jsonify({"employees": employee_cache.stats(), "projects": project_cache.stats()})
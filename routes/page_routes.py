@@ -0,0 +1,11 @@
+from flask import Blueprint, render_template
+
+page_bp = Blueprint('page_bp', __name__)
+
+@page_bp.route('/projects', methods=['POST', 'GET'])
+def project_home():
+    return render_template("projects.html")
+
+@page_bp.route('/employee_dashboard', methods=['POST', 'GET'])
+def employee_home():
+    return render_template("employees.html")
@@ -1,16 +1,148 @@
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, Response, request, jsonify, stream_with_context
+from sqlalchemy import exists, or_
+from sqlalchemy.orm import load_only
 from models.project import Project
+from models.task import Task
+from models.generation_job import GenerationJob
 from database.db import db
+from controllers.project_controller import load_project_tree
+from controllers.pagination import InvalidListParams, keyset_page, list_response, page_limit, project_row, requested_fields
+from controllers.http_cache import conditional_json
+from controllers.reference_cache import project_cache
+from routes.sse import format_sse
 
 project_bp = Blueprint('project_bp', __name__)
 
-@project_bp.route('/add', methods=['POST'])
+# The AI modules (OpenAI client, LLM gateway) are imported inside the views
+# that need them so booting a worker does not pay for them.
+
+@project_bp.route('/api/generate_tasks/<string:project_id>', methods=['POST', 'GET'])
+def generate_tasks(project_id):
+    """Generate tasks using AI and assign initial subtasks.
+
+    POST queues the generation on the background worker pool and returns 202
+    with a job id to poll. With ``?stream=1`` (or ``Accept: text/event-stream``)
+    every task is pushed as a server-sent event as soon as it has been parsed
+    from the completion. A plain GET still generates synchronously.
+    """
+    if request.args.get("stream") or request.accept_mimetypes.best == "text/event-stream":
+        from ai.task_generator import stream_tasks_from_description
+
+        events = stream_tasks_from_description(project_id)
+        return Response(
+            stream_with_context(format_sse(event, data) for event, data in events),
+            mimetype="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+        )
+
+    if request.method == 'POST':
+        from ai.generation_jobs import generation_job_queue
+
+        if not project_cache.get(project_id):
+            return jsonify({"error": "Project not found"}), 404
+        job = generation_job_queue.enqueue(project_id)
+        return jsonify({
+            "job_id": job.id,
+            "status": job.status,
+            "status_url": f"/api/generation_jobs/{job.id}"
+        }), 202
+
+    from ai.task_generator import generate_tasks_from_description
+
+    result = generate_tasks_from_description(project_id)
+    return jsonify(result)
+
+@project_bp.route('/api/generate_tasks', methods=['POST'])
+def generate_tasks_batch():
+    """Generate tasks for many projects at once: ``{"project_ids": [...]}``.
+
+    LLM calls run concurrently, all trees are stored in one transaction and
+    a single assignment pass runs at the end. Reports a result per project.
+    """
+    from ai.task_generator import generate_tasks_for_projects
+
+    data = request.get_json(silent=True) or {}
+    project_ids = data.get("project_ids")
+    if not isinstance(project_ids, list) or not project_ids:
+        return jsonify({"error": "project_ids must be a non-empty list"}), 400
+
+    results = generate_tasks_for_projects(list(dict.fromkeys(map(str, project_ids))))
+    succeeded = sum(1 for r in results.values() if "error" not in r)
+    return jsonify({"succeeded": succeeded, "failed": len(results) - succeeded, "results": results})
+
+@project_bp.route('/api/generation_jobs/<int:job_id>', methods=['GET'])
+def get_generation_job(job_id):
+    """Status, progress and result of a queued task generation."""
+    from ai.generation_jobs import serialize_job
+
+    job = GenerationJob.query.get(job_id)
+    if not job:
+        return jsonify({"error": "Job not found"}), 404
+    return jsonify(serialize_job(job))
+
+@project_bp.route('/api/llm_cache/stats', methods=['GET'])
+def llm_cache_stats():
+    """Hit/miss metrics of the cached task breakdowns."""
+    from ai.task_generator import completion_cache
+
+    return jsonify(completion_cache.stats())
+
+PROJECT_FIELDS = {
+    "project_id": lambda p: p.project_id,
+    "description": lambda p: p.description,
+}
+
+@project_bp.route('/api/projects', methods=['GET'])
+def get_projects():
+    """Fetch projects a page at a time.
+
+    ``?limit=`` / ``?cursor=`` page through by project id, ``?fields=`` picks
+    the returned fields and ``?status=open|completed`` keeps projects with or
+    without unfinished tasks.
+    """
+    fields = requested_fields(PROJECT_FIELDS, PROJECT_FIELDS)
+    query = Project.query.options(load_only(*[getattr(Project, field) for field in fields]))
+
+    status = request.args.get("status")
+    if status:
+        #  Task.status is nullable: rows written without one are still open
+        open_task = exists().where(Task.project_id == Project.project_id, or_(Task.status != 1, Task.status.is_(None)))
+        if status == "open":
+            query = query.filter(open_task)
+        elif status == "completed":
+            query = query.filter(~open_task, exists().where(Task.project_id == Project.project_id))
+        else:
+            raise InvalidListParams("status must be 'open' or 'completed'")
+
+    projects, next_cursor = keyset_page(query, [Project.project_id], page_limit())
+    return list_response([project_row(p, fields, PROJECT_FIELDS) for p in projects], next_cursor)
+
+@project_bp.route('/api/projects', methods=['POST'])
 def add_project():
-    data = request.json
-    new_project = Project(
-        project_id=data.get('project_id'),
-        description=data.get('description')
-    )
+    """Add a new project to the database."""
+    data = request.json  # Get JSON data from request
+
+    #  Validate input
+    if not data or 'project_id' not in data or 'description' not in data:
+        return jsonify({"error": "Missing project_id or description"}), 400
+
+    #  Check if project ID already exists
+    existing_project = Project.query.filter_by(project_id=data['project_id']).first()
+    if existing_project:
+        return jsonify({"error": "Project ID already exists!"}), 400
+
+    #  Create and add new project to the database
+    new_project = Project(project_id=data['project_id'], description=data['description'])
     db.session.add(new_project)
     db.session.commit()
-    return jsonify({"message": "Project added successfully!"}), 201
+    project_cache.invalidate(new_project.project_id)
+
+    return jsonify({"message": "Project added successfully!", "project_id": data['project_id']}), 201
+
+@project_bp.route('/api/project_details/<string:project_id>', methods=['GET'])
+def get_project_details(project_id):
+    """Fetch project details including tasks, subtasks, milestones, and assigned employees.
+
+    Answers ``If-None-Match`` with 304 while the project is unchanged.
+    """
+    return conditional_json("project", project_id, lambda: load_project_tree(project_id))
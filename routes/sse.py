@@ -0,0 +1,7 @@
+import json
+
+
+def format_sse(event, data, event_id=None):
+    """Encode one server-sent event; ``event_id`` lets the client resume with Last-Event-ID."""
+    prefix = f"id: {event_id}\n" if event_id is not None else ""
+    return f"{prefix}event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
@@ -0,0 +1,91 @@
+import os
+import sys
+import tempfile
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+#  Config is read at import time: point it at a throwaway SQLite file before the app is imported
+_TMP = tempfile.mkdtemp(prefix="project-management-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_TMP, 'test.db')}"
+os.environ["LLM_CACHE_ENABLED"] = "0"
+os.environ["LLM_CACHE_PATH"] = os.path.join(_TMP, "llm_cache.sqlite3")
+os.environ["START_BACKGROUND_SERVICES"] = "0"
+os.environ.setdefault("OPENAI_API_KEY", "sk-test")
+
+from app import create_app  # noqa: E402
+from database.db import db as _db  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def app():
+    app = create_app()
+    app.config["TESTING"] = True
+    return app
+
+
+@pytest.fixture
+def db(app):
+    """Empty schema and empty per-process caches for every test."""
+    from controllers import http_cache
+    from controllers.http_cache import LocalResponseCache
+    from controllers.reference_cache import employee_cache, project_cache
+
+    with app.app_context():
+        _db.drop_all()
+        _db.create_all()
+        employee_cache._store = LocalResponseCache(employee_cache._store.max_entries)
+        project_cache._store = LocalResponseCache(project_cache._store.max_entries)
+        http_cache.response_cache = LocalResponseCache(http_cache.response_cache.max_entries)
+        yield _db
+        _db.session.remove()
+
+
+@pytest.fixture
+def client(app, db):
+    return app.test_client()
+
+
+@pytest.fixture
+def make_project(db):
+    """Insert a project with ``tasks`` × ``subtasks`` × ``milestones`` open rows and return its id."""
+    from models.project import Project
+    from models.task import Task, Subtask, Milestone
+
+    def make(project_id="P1", tasks=3, subtasks=3, milestones=5, words=("api", "react", "database", "testing", "deploy")):
+        db.session.add(Project(project_id=project_id, description=f"{project_id} description"))
+        for t in range(tasks):
+            task = Task(name=f"Task {t}", project_id=project_id, status=0, total_subtasks=subtasks, completed_subtasks=0)
+            db.session.add(task)
+            db.session.flush()
+            for s in range(subtasks):
+                subtask = Subtask(
+                    name=f"Build {words[(t + s) % len(words)]} part {s}", task_id=task.id,
+                    status=0, total_milestones=milestones, completed_milestones=0
+                )
+                db.session.add(subtask)
+                db.session.flush()
+                for m in range(milestones):
+                    db.session.add(Milestone(milestone_name=f"Milestone {m}", subtask_id=subtask.id, status=0))
+        db.session.commit()
+        return project_id
+
+    return make
+
+
+@pytest.fixture
+def make_employees(db):
+    """Insert ``count`` employees with rotating skills and return them."""
+    from models.employee import Employee
+
+    def make(count=4, skills=("python, api", "frontend, react", "database, sql", "testing, api")):
+        employees = [
+            Employee(employee_id=f"E{i}", name=f"Employee {i}", skills=skills[i % len(skills)])
+            for i in range(count)
+        ]
+        db.session.add_all(employees)
+        db.session.commit()
+        return employees
+
+    return make
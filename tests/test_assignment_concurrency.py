@@ -0,0 +1,107 @@
+import random
+import threading
+import pytest
+from sqlalchemy import event, func
+from ai.assignment_log_writer import assignment_log_writer
+from ai.skill_index import rebuild_index
+from ai.task_assigner import AITaskAssignmentAgent
+from models.assignment import Assignment
+from models.task import Milestone, Subtask
+
+THREADS = 8
+ROUNDS = 10
+
+
+@pytest.fixture
+def concurrent_db(db):
+    """SQLite in WAL mode with a busy timeout, so writers queue up instead of failing at once."""
+    def configure(dbapi_connection, connection_record):
+        dbapi_connection.execute("PRAGMA journal_mode=WAL")
+        dbapi_connection.execute("PRAGMA busy_timeout=10000")
+
+    db.session.remove()
+    db.engine.dispose()
+    event.listen(db.engine, "connect", configure)
+    yield db
+    assignment_log_writer.flush()
+    db.session.remove()
+    event.remove(db.engine, "connect", configure)
+    db.engine.dispose()
+
+
+def test_concurrent_assignment_never_double_assigns(app, concurrent_db, make_project, make_employees):
+    db = concurrent_db
+    employees = make_employees(16, skills=("python, api",))
+    make_project("P1", tasks=10, subtasks=4, milestones=3, words=("api",))
+    rebuild_index()
+    db.session.commit()
+    employee_ids = [employee.id for employee in employees]
+
+    agent = AITaskAssignmentAgent(max_capacity=2)
+    start = threading.Barrier(THREADS)
+    errors = []
+
+    def worker(index):
+        rng = random.Random(index)
+        start.wait()
+        for _ in range(ROUNDS):
+            with app.app_context():
+                try:
+                    if index % 2:
+                        result = agent.assign_tasks()
+                    else:
+                        result = agent.assign_next_subtask(rng.choice(employee_ids))
+                    if "error" in result:
+                        errors.append(result["error"])
+                except Exception as e:
+                    errors.append(repr(e))
+
+    threads = [threading.Thread(target=worker, args=(index,)) for index in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    duplicates = (
+        db.session.query(Assignment.subtask_id)
+        .group_by(Assignment.subtask_id)
+        .having(func.count(Assignment.id) > 1)
+        .all()
+    )
+    assert duplicates == []
+
+    assignments = {subtask_id: employee_id for employee_id, subtask_id in db.session.query(Assignment.employee_id, Assignment.subtask_id)}
+    assert assignments
+    for subtask in Subtask.query.filter(Subtask.employee_id.isnot(None)):
+        assert assignments[subtask.id] == str(subtask.employee_id)
+
+    #  Every claimed subtask got its milestones in the same transaction
+    owners = db.session.query(Milestone.employee_id, Subtask.employee_id).join(Subtask, Milestone.subtask_id == Subtask.id)
+    mismatched = [(milestone_owner, subtask_owner) for milestone_owner, subtask_owner in owners
+                  if (milestone_owner and str(milestone_owner)) != subtask_owner]
+    assert mismatched == []
+
+
+def test_assign_next_subtask_commits_claim_and_milestones_together(db, make_project, make_employees):
+    employee = make_employees(1, skills=("api",))[0]
+    make_project("P1", tasks=1, subtasks=1, milestones=3, words=("api",))
+    rebuild_index()
+    db.session.commit()
+    commits = []
+    thread_id = threading.get_ident()
+
+    def record(connection):
+        if threading.get_ident() == thread_id:  # ✅ The log writer commits on its own thread
+            commits.append(connection)
+
+    event.listen(db.engine, "commit", record)
+    try:
+        result = AITaskAssignmentAgent().assign_next_subtask(employee.id)
+    finally:
+        event.remove(db.engine, "commit", record)
+    assignment_log_writer.flush()
+
+    assert "assigned" in result["message"]
+    assert len(commits) == 1
+    assert [milestone.employee_id for milestone in Milestone.query] == [employee.id] * 3
@@ -0,0 +1,45 @@
+import pytest
+from ai.assignment_log_writer import AssignmentLogWriter
+from models.logs import AssignmentLog
+
+
+@pytest.fixture
+def writer(db):
+    writer = AssignmentLogWriter(batch_size=2, max_latency=0.05, retries=1, retry_delay=0)
+    yield writer
+    writer.close()
+
+
+def test_failed_batch_is_retried(db, writer, monkeypatch):
+    insert = writer._insert
+    attempts = []
+
+    def flaky(rows):
+        attempts.append(len(rows))
+        return len(attempts) > 1 and insert(rows)
+
+    monkeypatch.setattr(writer, "_insert", flaky)
+    writer.write(1, "first")
+    writer.write(1, "second")
+    writer.flush()
+
+    assert attempts == [2, 2]
+    assert sorted(log.log_message for log in AssignmentLog.query) == ["first", "second"]
+
+
+def test_batch_that_keeps_failing_reports_its_entries(db, writer, monkeypatch, capsys):
+    monkeypatch.setattr(writer, "_insert", lambda rows: False)
+    writer.write(7, "never stored")
+    writer.flush()
+
+    assert "Lost log entry for Employee 7" in capsys.readouterr().out
+    assert AssignmentLog.query.count() == 0
+
+
+def test_write_after_close_is_dropped_with_a_warning(capsys):
+    writer = AssignmentLogWriter()
+    writer.close()
+
+    writer.write(7, "too late")  # ✅ Outside any app context, as at interpreter exit
+
+    assert "dropping log entry for Employee 7: too late" in capsys.readouterr().out
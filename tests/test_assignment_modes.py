@@ -0,0 +1,24 @@
+import pytest
+from ai.skill_index import rebuild_index
+from models.assignment import Assignment
+
+
+def test_unknown_mode_is_400(client):
+    response = client.post("/api/assign_tasks?mode=optimal")
+
+    assert response.status_code == 400
+    assert response.get_json() == {"error": "mode must be 'greedy' or 'global'"}
+
+
+@pytest.mark.parametrize("mode", ["greedy", "global"])
+def test_known_modes_assign(client, db, make_project, make_employees, mode):
+    make_employees(2, skills=("python, api",))
+    make_project("P1", tasks=1, subtasks=2, milestones=1, words=("api",))
+    rebuild_index()
+    db.session.commit()
+
+    response = client.post(f"/api/assign_tasks?mode={mode}")
+
+    assert response.status_code == 200
+    assert response.get_json()["assigned"] == 2
+    assert Assignment.query.count() == 2
@@ -0,0 +1,25 @@
+import threading
+from ai.assignment_scheduler import assignment_scheduler
+from ai.generation_jobs import generation_job_queue
+from models.generation_job import GenerationJob
+
+SERVICE_THREADS = ("assignment-scheduler", "generation-worker")
+
+
+def service_threads():
+    return [thread.name for thread in threading.enumerate() if thread.name.startswith(SERVICE_THREADS)]
+
+
+def test_disabled_services_never_start(app, client, make_project):
+    assert app.config["START_BACKGROUND_SERVICES"] is False  # Set by conftest
+    make_project("P1", tasks=0)
+
+    assert client.post("/api/employees", json={"employee_id": "E1", "name": "Ada", "skills": "python"}).status_code == 201
+    response = client.post("/api/generate_tasks/P1")
+    assert response.status_code == 202
+    assignment_scheduler.notify_subtask_completed(1)
+
+    assert service_threads() == []
+    assert assignment_scheduler._thread is None
+    assert generation_job_queue._threads == []
+    assert GenerationJob.query.one().status == "queued"  # ✅ Waits for a process that runs the workers
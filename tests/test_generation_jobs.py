@@ -0,0 +1,70 @@
+import time
+import ai.task_generator
+from ai.generation_jobs import GenerationJobQueue
+from models.generation_job import GenerationJob
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.02)
+
+
+def job_statuses(db):
+    db.session.expire_all()
+    return [(job.status, job.error) for job in GenerationJob.query.order_by(GenerationJob.id)]
+
+
+def test_worker_survives_a_failing_job(app, db, monkeypatch):
+    def generate(project_id):
+        yield "done", {"message": "ok", "project_id": project_id}
+
+    monkeypatch.setattr(ai.task_generator, "stream_tasks_from_description", generate)
+    queue = GenerationJobQueue(workers=1, poll_interval=0.05)
+    run = queue._run
+    calls = []
+
+    def flaky_run(job_id):
+        calls.append(job_id)
+        if len(calls) == 1:
+            raise RuntimeError("database went away")
+        run(job_id)
+
+    queue._run = flaky_run
+    queue.start(app)  # ✅ enqueue() leaves starting to us with START_BACKGROUND_SERVICES off
+    queue.enqueue("P1")
+    queue.enqueue("P2")
+    try:
+        wait_for(lambda: all(status not in ("queued", "running") for status, _ in job_statuses(db)))
+        assert job_statuses(db) == [("failed", "Unexpected error: database went away"), ("succeeded", None)]
+        assert all(thread.is_alive() for thread in queue._threads)
+    finally:
+        queue.close()
+
+
+def test_start_replaces_dead_workers(app, db):
+    queue = GenerationJobQueue(workers=2, poll_interval=0.05)
+    queue._work = lambda: None  # Workers exit straight away
+    queue.start(app)
+    for thread in queue._threads:
+        thread.join()
+
+    del queue._work
+    queue.start(app)
+    try:
+        assert len(queue._threads) == 2
+        assert all(thread.is_alive() for thread in queue._threads)
+    finally:
+        queue.close()
+
+
+def test_close_stops_workers(app, db):
+    queue = GenerationJobQueue(workers=2, poll_interval=5)
+    queue.start(app)
+
+    queue.close()
+
+    assert not any(thread.is_alive() for thread in queue._threads)
+    queue.start(app)
+    assert not any(thread.is_alive() for thread in queue._threads)
@@ -0,0 +1,27 @@
+from ai.change_feed import change, record_changes
+from controllers.http_cache import current_version
+
+
+def test_log_entries_keep_employee_etag_valid(client, db, make_employees):
+    make_employees(1)
+    first = client.get("/api/employees/1/tasks")
+    etag = first.headers["ETag"]
+
+    record_changes([change("log_added", {"message": "Assigned subtask"}, employee_id=1)])
+    db.session.commit()
+
+    assert current_version("employee", 1) == 0
+    assert client.get("/api/employees/1/tasks", headers={"If-None-Match": etag}).status_code == 304
+
+
+def test_assignment_invalidates_employee_and_project_etags(client, db, make_employees, make_project):
+    make_employees(1)
+    make_project("P1", tasks=1, subtasks=1, milestones=1)
+    employee_etag = client.get("/api/employees/1/tasks").headers["ETag"]
+    project_etag = client.get("/api/project_details/P1").headers["ETag"]
+
+    record_changes([change("subtask_assigned", {"subtask_id": 1}, "P1", 1)])
+    db.session.commit()
+
+    assert client.get("/api/employees/1/tasks", headers={"If-None-Match": employee_etag}).status_code == 200
+    assert client.get("/api/project_details/P1", headers={"If-None-Match": project_etag}).status_code == 200
@@ -0,0 +1,40 @@
+import pytest
+import sqlalchemy as sa
+from models.assignment import Assignment
+from models.change_event import ChangeEvent
+from models.employee_skill import EmployeeSkill
+from models.generation_job import GenerationJob
+from models.logs import AssignmentLog
+from models.subtask_token import SubtaskToken
+from models.task import Milestone, Subtask, Task
+
+
+def query_plan(db, query):
+    """SQLite's EXPLAIN QUERY PLAN for an ORM query, as one string."""
+    statement = getattr(query, "statement", query)
+    sql = str(statement.compile(db.engine, compile_kwargs={"literal_binds": True}))
+    return " | ".join(row[-1] for row in db.session.execute(sa.text(f"EXPLAIN QUERY PLAN {sql}")))
+
+
+HOT_QUERIES = [
+    ("ix_tasks_project_id", lambda: Task.query.filter_by(project_id="P1")),
+    ("ix_subtasks_task_id", lambda: Subtask.query.filter(Subtask.task_id.in_([1, 2, 3]))),
+    ("ix_subtasks_status_employee_id", lambda: Subtask.query.filter(Subtask.status == 0, Subtask.employee_id.is_(None))),
+    ("ix_milestones_subtask_id_employee_id", lambda: Milestone.query.filter(Milestone.subtask_id.in_([1, 2]), Milestone.employee_id.is_(None))),
+    ("ix_assignments_employee_id_status", lambda: Assignment.query.filter_by(employee_id="1", status=1)),
+    ("ix_assignments_project_id", lambda: Assignment.query.filter_by(project_id="P1")),
+    ("ix_assignments_subtask_id", lambda: Assignment.query.filter(Assignment.subtask_id.in_([1, 2]))),
+    ("ix_assignment_log_employee_id_timestamp", lambda: AssignmentLog.query.filter_by(employee_id="1").order_by(AssignmentLog.timestamp)),
+    ("ix_subtask_tokens_subtask_id", lambda: SubtaskToken.query.filter(SubtaskToken.subtask_id.in_([1, 2]))),
+    ("ix_employee_skills_skill", lambda: EmployeeSkill.query.filter_by(skill="python")),
+    ("ix_generation_jobs_status_id", lambda: GenerationJob.query.filter_by(status="queued").order_by(GenerationJob.id)),
+    ("ix_change_events_project_id_id", lambda: ChangeEvent.query.filter(ChangeEvent.project_id == "P1", ChangeEvent.id > 10)),
+]
+
+
+@pytest.mark.parametrize("index, build", HOT_QUERIES, ids=[index for index, _ in HOT_QUERIES])
+def test_hot_query_uses_index(db, index, build):
+    plan = query_plan(db, build())
+
+    assert f"INDEX {index}" in plan, plan
+    assert "TEMP B-TREE" not in plan, plan  # ✅ No sort step for the ordered lookups
@@ -0,0 +1,148 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import openai
+import pytest
+from ai.llm_gateway import LLMGateway
+
+TEXT = "Task 1: Build the API\n- Subtask 1.1: Design endpoints\n  - Milestone 1.1.1: Draft the schema"
+MESSAGES = [{"role": "user", "content": "Break this project down"}]
+
+
+class FakeOpenAI(BaseHTTPRequestHandler):
+    """Chat completions endpoint that can throttle, stall and count concurrent requests."""
+
+    fail_first = 0  # Answer the first N requests with 429
+    delay = 0.0  # Seconds before answering
+    chunk_delay = 0.0  # Seconds between streamed chunks
+    calls = 0
+    active = 0
+    peak_active = 0
+    lock = threading.Lock()
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        cls = type(self)
+        with cls.lock:
+            cls.calls += 1
+            call = cls.calls
+            cls.active += 1
+            cls.peak_active = max(cls.peak_active, cls.active)
+        try:
+            if call <= cls.fail_first:
+                self._send_json(429, {"error": {"message": "rate limited"}}, {"Retry-After": "0"})
+                return
+            time.sleep(cls.delay)
+            if body.get("stream"):
+                self._send_stream()
+            else:
+                self._send_json(200, {
+                    "id": "cmpl", "object": "chat.completion", "created": 0, "model": body["model"],
+                    "choices": [{"index": 0, "message": {"role": "assistant", "content": TEXT}, "finish_reason": "stop"}],
+                })
+        finally:
+            with cls.lock:
+                cls.active -= 1
+
+    def _send_json(self, status, payload, headers=None):
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_stream(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.end_headers()
+        try:
+            for i in range(0, len(TEXT), 7):
+                chunk = {
+                    "id": "cmpl", "object": "chat.completion.chunk", "created": 0, "model": "m",
+                    "choices": [{"index": 0, "delta": {"content": TEXT[i:i + 7]}, "finish_reason": None}],
+                }
+                self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+                self.wfile.flush()
+                time.sleep(type(self).chunk_delay)
+            self.wfile.write(b"data: [DONE]\n\n")
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # ✅ Client closed the stream early
+
+
+@pytest.fixture
+def fake_openai(monkeypatch):
+    handler = type("Handler", (FakeOpenAI,), {"lock": threading.Lock()})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setenv("OPENAI_BASE_URL", f"http://127.0.0.1:{server.server_address[1]}/v1")
+    yield handler
+    server.shutdown()
+    server.server_close()
+
+
+def make_gateway(**overrides):
+    options = dict(api_key="sk-test", timeout=10, max_retries=3, backoff_base=0.01,
+                   max_in_flight=4, rate_limit=1000, rate_limit_burst=1000)
+    options.update(overrides)
+    return LLMGateway(**options)
+
+
+def test_retries_throttled_requests(fake_openai):
+    fake_openai.fail_first = 2
+
+    assert make_gateway().complete(MESSAGES, "gpt-4", 0.7) == TEXT
+    assert fake_openai.calls == 3
+
+
+def test_gives_up_after_max_retries(fake_openai):
+    fake_openai.fail_first = 10
+
+    with pytest.raises(openai.RateLimitError):
+        make_gateway(max_retries=2).complete(MESSAGES, "gpt-4", 0.7)
+    assert fake_openai.calls == 3
+
+
+def test_caps_requests_in_flight(fake_openai):
+    fake_openai.delay = 0.2
+
+    results = make_gateway(max_in_flight=2).complete_many([MESSAGES] * 6, "gpt-4", 0.7)
+
+    assert results == [TEXT] * 6
+    assert fake_openai.peak_active == 2
+
+
+def test_rate_limits_requests(fake_openai):
+    start = time.monotonic()
+    make_gateway(rate_limit=5, rate_limit_burst=2).complete_many([MESSAGES] * 8, "gpt-4", 0.7)
+
+    #  Two requests from the burst, the other six at 5 per second
+    assert time.monotonic() - start >= 1.1
+    assert fake_openai.calls == 8
+
+
+def test_stream_retries_through_the_limiter(fake_openai):
+    fake_openai.fail_first = 1
+
+    assert "".join(make_gateway().stream(MESSAGES, "gpt-4", 0.7)) == TEXT
+    assert fake_openai.calls == 2
+
+
+def test_closing_a_stream_frees_its_slot(fake_openai):
+    fake_openai.chunk_delay = 0.5  # The full stream would take about 7 seconds
+    gateway = make_gateway(max_in_flight=1, timeout=2)
+
+    chunks = gateway.stream(MESSAGES, "gpt-4", 0.7)
+    assert next(chunks) == TEXT[:7]
+    chunks.close()
+
+    #  With one slot, this only gets through once the abandoned stream has been cancelled
+    start = time.monotonic()
+    assert gateway.complete(MESSAGES, "gpt-4", 0.7) == TEXT
+    assert time.monotonic() - start < 2
@@ -0,0 +1,80 @@
+import os
+import pytest
+import sqlalchemy as sa
+from alembic.autogenerate import compare_metadata
+from alembic.migration import MigrationContext
+from flask_migrate import downgrade, stamp, upgrade
+from app import create_app
+from config import Config
+from database.db import db
+from models.subtask_token import SubtaskToken
+
+MIGRATIONS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "migrations")
+
+
+@pytest.fixture
+def migrated_app(db, tmp_path):
+    """An app on its own empty SQLite file, schema managed by the migrations only."""
+    class MigrationConfig(Config):
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'migrated.db'}"
+
+    app = create_app(MigrationConfig)
+    with app.app_context():
+        yield app
+        db.session.remove()
+        db.engine.dispose()
+
+
+def postings():
+    return set(db.session.query(SubtaskToken.token, SubtaskToken.subtask_id))
+
+
+def test_upgrade_backfills_subtask_tokens(migrated_app, make_project):
+    from ai.skill_index import rebuild_index
+    from models.task import Subtask
+
+    upgrade(directory=MIGRATIONS, revision="d7b1f4a83e26")
+    make_project("P1", tasks=2, subtasks=3, milestones=1)
+    assigned = Subtask.query.first()
+    assigned.employee_id = 1
+    assigned.status = 1
+    db.session.commit()
+    assert postings() == set()
+
+    upgrade(directory=MIGRATIONS)
+    backfilled = postings()
+
+    rebuild_index()
+    db.session.commit()
+    assert backfilled == postings()
+    assert backfilled and assigned.id not in {subtask_id for _, subtask_id in backfilled}
+
+    downgrade(directory=MIGRATIONS, revision="d7b1f4a83e26")
+    upgrade(directory=MIGRATIONS)  # ✅ Re-running the backfill is idempotent
+    assert postings() == backfilled
+
+
+def schema_drift():
+    with db.engine.connect() as connection:
+        context = MigrationContext.configure(connection, opts={"compare_type": True})
+        return compare_metadata(context, db.metadata)
+
+
+def test_upgrade_matches_models(migrated_app):
+    upgrade(directory=MIGRATIONS, revision="d7b1f4a83e26")
+    db.session.execute(sa.text("INSERT INTO employees (employee_id, name, skills) VALUES ('E1', 'Legacy', NULL)"))
+    db.session.commit()
+
+    upgrade(directory=MIGRATIONS)
+
+    assert schema_drift() == []
+    assert db.session.execute(sa.text("SELECT skills FROM employees")).scalar() == ""
+
+
+def test_create_all_database_upgrades_cleanly(migrated_app):
+    db.create_all()
+    stamp(directory=MIGRATIONS, revision="d7b1f4a83e26")
+
+    upgrade(directory=MIGRATIONS)
+
+    assert schema_drift() == []
@@ -0,0 +1,27 @@
+import time
+from models.task import Subtask
+
+
+def test_completing_a_milestone_twice_keeps_the_original_time(client, db, make_project, monkeypatch):
+    from ai.assignment_scheduler import assignment_scheduler
+
+    monkeypatch.setattr(assignment_scheduler, "notify_subtask_completed", lambda employee_id: None)
+    make_project("P1", tasks=1, subtasks=1, milestones=2)
+
+    first = client.post("/api/milestone_complete/1")
+    time.sleep(0.01)
+    second = client.post("/api/milestone_complete/1")
+
+    assert first.status_code == 200
+    assert first.get_json()["message"] == "Milestone marked as completed!"
+    assert second.status_code == 200
+    assert second.get_json() == {
+        "message": "Milestone was already completed.",
+        "completed_at": first.get_json()["completed_at"],
+        "already_completed": True,
+    }
+    assert db.session.get(Subtask, 1).completed_milestones == 1
+
+
+def test_completing_a_missing_milestone_is_404(client):
+    assert client.post("/api/milestone_complete/99").status_code == 404
@@ -0,0 +1,55 @@
+import re
+from models.logs import AssignmentLog
+
+NEXT_LINK = re.compile(r'<([^>]+)>;\s*rel="next"')
+
+
+def fetch_all_pages(client, url):
+    """Follow ``Link: rel="next"`` the way the dashboards do; returns the items and the page count."""
+    items, pages = [], 0
+    while url:
+        response = client.get(url)
+        assert response.status_code == 200
+        items.extend(response.get_json())
+        pages += 1
+        match = NEXT_LINK.search(response.headers.get("Link", ""))
+        url = match.group(1) if match else None
+    return items, pages
+
+
+def test_employee_pages_cover_every_row(client, make_employees):
+    make_employees(250)
+
+    employees, pages = fetch_all_pages(client, "/api/employees")
+
+    assert pages == 3
+    assert [employee["name"] for employee in employees] == [f"Employee {i}" for i in range(250)]
+
+
+def test_log_pages_keep_time_order_and_filters(client, db, make_employees):
+    make_employees(2)
+    db.session.add_all([AssignmentLog(employee_id="1", log_message=f"log {i}") for i in range(120)])
+    db.session.add(AssignmentLog(employee_id="2", log_message="other employee"))
+    db.session.commit()
+
+    logs, pages = fetch_all_pages(client, "/api/logs/1?limit=50&fields=message")
+
+    assert pages == 3
+    assert logs == [{"message": f"log {i}"} for i in range(120)]
+
+
+def test_project_status_filter_treats_null_task_status_as_open(client, db, make_project):
+    from models.task import Task
+
+    make_project("P1", tasks=1, subtasks=0)
+    make_project("P2", tasks=1, subtasks=0)
+    make_project("P3", tasks=0)
+    db.session.get(Task, 1).status = None  # ✅ Legacy row written without a status
+    db.session.get(Task, 2).status = 1
+    db.session.commit()
+
+    open_projects, _ = fetch_all_pages(client, "/api/projects?status=open&fields=project_id")
+    completed_projects, _ = fetch_all_pages(client, "/api/projects?status=completed&fields=project_id")
+
+    assert open_projects == [{"project_id": "P1"}]
+    assert completed_projects == [{"project_id": "P2"}]
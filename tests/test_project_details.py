@@ -0,0 +1,58 @@
+import threading
+from contextlib import contextmanager
+from sqlalchemy import event
+from models.assignment import Assignment
+from models.task import Subtask, Task
+
+
+@contextmanager
+def count_statements(engine):
+    """Statements run on ``engine`` by this thread (the test client serves requests inline)."""
+    statements = []
+    thread_id = threading.get_ident()
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if threading.get_ident() == thread_id:  # ✅ Ignore background services polling the same database
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+def project_details(client, db, project_id):
+    with count_statements(db.engine) as statements:
+        response = client.get(f"/api/project_details/{project_id}")
+    assert response.status_code == 200
+    return response.get_json(), len(statements)
+
+
+def assign_all_subtasks(db, project_id, employees):
+    """Spread the project's subtasks over ``employees`` (Assignment.employee_id holds Employee.id)."""
+    subtasks = Subtask.query.join(Task).filter(Task.project_id == project_id).order_by(Subtask.id).all()
+    for index, subtask in enumerate(subtasks):
+        employee = employees[index % len(employees)]
+        subtask.employee_id = employee.id
+        subtask.status = 1
+        db.session.add(Assignment(employee_id=str(employee.id), project_id=project_id, subtask_id=subtask.id))
+    db.session.commit()
+
+
+def test_project_details_query_count_does_not_grow_with_the_project(client, db, make_project, make_employees):
+    employees = make_employees(10)
+    make_project("SMALL", tasks=1, subtasks=1, milestones=1)
+    make_project("LARGE", tasks=10, subtasks=5, milestones=5)
+    assign_all_subtasks(db, "SMALL", employees[:1])
+    assign_all_subtasks(db, "LARGE", employees[1:])
+
+    small, small_queries = project_details(client, db, "SMALL")
+    large, large_queries = project_details(client, db, "LARGE")
+
+    assert len(small["tasks"]) == 1
+    assert len(large["tasks"]) == 10
+    assert sum(len(subtask["milestones"]) for task in large["tasks"] for subtask in task["subtasks"]) == 250
+    assert len(large["employees"]) == 9
+    #  Version, tasks, subtasks, milestones, subtask and project assignments, employees and their skills
+    assert large_queries == small_queries == 8
@@ -0,0 +1,93 @@
+import json
+import openai
+from ai import task_generator
+from models.task import Subtask
+
+
+def test_batch_reports_gateway_errors_per_project(db, make_project, monkeypatch):
+    def fail(*args, **kwargs):
+        raise openai.OpenAIError("The api_key client option must be set")
+
+    monkeypatch.setattr(task_generator.llm_gateway, "complete_many", fail)
+    make_project("P1", tasks=0)
+    make_project("P2", tasks=0)
+
+    results = task_generator.generate_tasks_for_projects(["P1", "P2", "P3"])
+
+    assert results == {
+        "P1": {"error": "OpenAI API error: The api_key client option must be set"},
+        "P2": {"error": "OpenAI API error: The api_key client option must be set"},
+        "P3": {"error": "Project not found"},
+    }
+
+
+BREAKDOWN = """**Backend Development**
+- Build the REST API
+    - Design endpoints
+    - Implement handlers
+- Set up the database
+    - Design tables
+
+**Frontend Development**
+- Build the dashboard
+    - Lay out the page
+    - Wire up the API
+
+**Testing**
+- Write integration tests
+    - Cover the API
+"""
+
+
+def parse_sse(lines):
+    """Yield ``(event, data)`` from an iterable of SSE byte chunks."""
+    buffer = ""
+    for chunk in lines:
+        buffer += chunk.decode()
+        while "\n\n" in buffer:
+            block, buffer = buffer.split("\n\n", 1)
+            fields = dict(line.split(": ", 1) for line in block.splitlines() if ": " in line)
+            yield fields["event"], json.loads(fields["data"])
+
+
+def test_stream_sends_tasks_before_done(client, db, make_project, monkeypatch):
+    chunks = [BREAKDOWN[i:i + 7] for i in range(0, len(BREAKDOWN), 7)]
+    consumed = []
+    queued = []
+
+    def fake_stream(messages, model, temperature):
+        for chunk in chunks:
+            consumed.append(chunk)
+            yield chunk
+
+    monkeypatch.setattr(task_generator.llm_gateway, "stream", fake_stream)
+    monkeypatch.setattr(task_generator.assignment_scheduler, "notify_subtasks_created", lambda ids: queued.extend(ids))
+    make_project("P1", tasks=0)
+
+    response = client.post("/api/generate_tasks/P1?stream=1", buffered=False)
+    assert response.mimetype == "text/event-stream"
+
+    events = []
+    for event, data in parse_sse(response.response):
+        events.append((event, data, len(consumed)))
+    response.close()
+
+    assert [event for event, _, _ in events] == ["task", "task", "task", "done"]
+    assert [data["name"] for _, data, _ in events[:3]] == ["Backend Development", "Frontend Development", "Testing"]
+    #  The first task reaches the client while the completion is still streaming
+    assert events[0][2] < len(chunks)
+    assert events[-1][1] == {"message": " Tasks, Subtasks, and Milestones generated; assignment queued.", "tasks": 3}
+    assert Subtask.query.count() == 4
+    assert sorted(queued) == [subtask.id for subtask in Subtask.query.order_by(Subtask.id)]
+
+
+def test_batch_reports_generated_projects_with_assignment_queued(db, make_project, monkeypatch):
+    queued = []
+    monkeypatch.setattr(task_generator.llm_gateway, "complete_many", lambda messages, model, temperature: [BREAKDOWN] * len(messages))
+    monkeypatch.setattr(task_generator.assignment_scheduler, "notify_subtasks_created", lambda ids: queued.extend(ids))
+    make_project("P1", tasks=0)
+
+    results = task_generator.generate_tasks_for_projects(["P1"])
+
+    assert results == {"P1": {"message": " Tasks, Subtasks, and Milestones generated; assignment queued.", "tasks": 3}}
+    assert len(queued) == Subtask.query.count() == 4
@@ -0,0 +1,48 @@
+from ai.task_assigner import AITaskAssignmentAgent
+from models.task import Subtask, Task
+
+
+def test_rollup_completes_flagged_tasks_and_clears_the_flag(db, make_project):
+    make_project("P1", tasks=2, subtasks=2, milestones=1)
+    finished, unfinished = Task.query.order_by(Task.id).all()
+    finished.status = None  # ✅ Legacy row written without a status
+    for subtask in Subtask.query.filter_by(task_id=finished.id):
+        subtask.status = 1
+        subtask.completed_milestones = 1
+    db.session.commit()
+    assert finished.needs_rollup and unfinished.needs_rollup  # ✅ New tasks start flagged
+
+    AITaskAssignmentAgent().check_and_update_task_status()
+
+    db.session.refresh(finished)
+    db.session.refresh(unfinished)
+    assert (finished.status, finished.needs_rollup) == (1, False)
+    assert (unfinished.status, unfinished.needs_rollup) == (0, False)
+
+
+def test_rollup_skips_tasks_without_the_flag(db, make_project):
+    make_project("P1", tasks=1, subtasks=1, milestones=1)
+    task = Task.query.one()
+    task.needs_rollup = False
+    subtask = Subtask.query.one()
+    subtask.status = 1
+    subtask.completed_milestones = 1
+    db.session.commit()
+
+    AITaskAssignmentAgent().check_and_update_task_status()
+
+    db.session.refresh(task)
+    assert task.status == 0
+
+
+def test_rollup_does_not_finish_subtasks_without_milestones(db, make_project):
+    make_project("P1", tasks=1, subtasks=1, milestones=0)
+    subtask = Subtask.query.one()
+    subtask.status = 1  # ✅ Assigned, which shares status 1 with completed
+    db.session.commit()
+
+    AITaskAssignmentAgent().check_and_update_task_status()
+
+    task = Task.query.one()
+    assert (task.status, task.needs_rollup) == (0, False)
+    assert task.completed_subtasks == 0  # ✅ Agrees with the completion counters